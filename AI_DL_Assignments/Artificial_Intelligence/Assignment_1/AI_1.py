@@ -1,5 +1,11 @@
 from collections import deque
-import copy
+import math
+import mmap
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import npuzzle
 
 # Goal state
 goal_state = [[1, 2, 3],
@@ -9,67 +15,259 @@ goal_state = [[1, 2, 3],
 # Moves: up, down, left, right
 moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]
 
+# ------------------------------
+# Packed state representation
+# ------------------------------
+# A board is packed into one int: cell k (row-major) holds its tile in
+# bits 4k..4k+3 and the blank index is cached in bits 36..39, so states
+# hash as plain ints and a move is a couple of integer additions.
+BLANK_SHIFT = 36
+
+
+def encode_state(state):
+    code = 0
+    blank = 0
+    for k, tile in enumerate(v for row in state for v in row):
+        code |= tile << (4 * k)
+        if tile == 0:
+            blank = k
+    return code | (blank << BLANK_SHIFT)
 
-def get_blank_pos(state):
-    for i in range(3):
-        for j in range(3):
-            if state[i][j] == 0:
-                return i, j
 
+def decode_state(code):
+    return [[(code >> (4 * (3 * i + j))) & 15 for j in range(3)] for i in range(3)]
 
-def generate_neighbors(state):
-    x, y = get_blank_pos(state)
+
+def _build_move_table():
+    # For every blank position: (target cell, shift of target, blank-index delta)
+    table = []
+    for b in range(9):
+        x, y = divmod(b, 3)
+        entries = []
+        for dx, dy in moves:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < 3 and 0 <= ny < 3:
+                t = 3 * nx + ny
+                entries.append((4 * t, 4 * b, (t - b) << BLANK_SHIFT))
+        table.append(tuple(entries))
+    return tuple(table)
+
+
+MOVE_TABLE = _build_move_table()
+GOAL = encode_state(goal_state)
+
+
+def generate_neighbors(code):
     neighbors = []
-    for dx, dy in moves:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < 3 and 0 <= ny < 3:
-            new_state = copy.deepcopy(state)
-            new_state[x][y], new_state[nx][ny] = new_state[nx][ny], new_state[x][y]
-            neighbors.append(new_state)
+    for t_shift, b_shift, delta in MOVE_TABLE[code >> BLANK_SHIFT]:
+        tile = (code >> t_shift) & 15
+        # Slide the tile into the blank cell and move the cached blank index
+        neighbors.append(code + (tile << b_shift) - (tile << t_shift) + delta)
     return neighbors
 
 
-def state_to_tuple(state):
-    return tuple(tuple(row) for row in state)
+def is_solvable(state, goal=goal_state):
+    # Sliding a tile on a 3-wide board never changes the parity of the
+    # number of inversions among the non-blank tiles
+    def parity(s):
+        tiles = [v for row in s for v in row if v != 0]
+        return sum(1 for i in range(8) for j in range(i + 1, 8) if tiles[i] > tiles[j]) & 1
+
+    return parity(state) == parity(goal)
 
 
-def bfs(start_state):
-    visited = set()
-    queue = deque([(start_state, [])])
-    visited.add(state_to_tuple(start_state))
+def reconstruct_path(parent, code):
+    path = []
+    while code is not None:
+        path.append(decode_state(code))
+        code = parent[code]
+    path.reverse()
+    return path
+
+
+def bfs(start_state, stats=None):
+    if not is_solvable(start_state):
+        if stats is not None:
+            stats["expanded"] = 0
+        return None
+    start = encode_state(start_state)
+    # parent doubles as the visited set; the path is rebuilt once at the goal
+    parent = {start: None}
+    queue = deque([start])
+    expanded = 0
 
     while queue:
-        state, path = queue.popleft()
-        if state == goal_state:
-            return path + [state]
-
-        for neighbor in generate_neighbors(state):
-            t = state_to_tuple(neighbor)
-            if t not in visited:
-                visited.add(t)
-                queue.append((neighbor, path + [state]))
+        code = queue.popleft()
+        if code == GOAL:
+            if stats is not None:
+                stats["expanded"] = expanded
+            return reconstruct_path(parent, code)
+
+        expanded += 1
+        for neighbor in generate_neighbors(code):
+            if neighbor not in parent:
+                parent[neighbor] = code
+                queue.append(neighbor)
+    if stats is not None:
+        stats["expanded"] = expanded
     return None
 
 
-def dfs(start_state, depth_limit=50):
-    visited = set()
+def bidirectional_bfs(start_state, goal=goal_state, stats=None):
+    if not is_solvable(start_state, goal):
+        if stats is not None:
+            stats["expanded"] = 0
+        return None
+    start, target = encode_state(start_state), encode_state(goal)
+    if start == target:
+        if stats is not None:
+            stats["expanded"] = 0
+        return [decode_state(start)]
+
+    # Side 0 grows from the start, side 1 from the goal
+    parents = ({start: None}, {target: None})
+    dists = ({start: 0}, {target: 0})
+    frontiers = [[start], [target]]
+    expanded = 0
+
+    while frontiers[0] and frontiers[1]:
+        # Expand one full layer of the smaller frontier, so the cheapest
+        # meeting point found in that layer gives an optimal path
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, dist, other_dist = parents[side], dists[side], dists[1 - side]
+        best, meet = None, None
+        next_frontier = []
+        for code in frontiers[side]:
+            expanded += 1
+            d = dist[code] + 1
+            for neighbor in generate_neighbors(code):
+                if neighbor in parent:
+                    continue
+                parent[neighbor] = code
+                dist[neighbor] = d
+                next_frontier.append(neighbor)
+                if neighbor in other_dist and (best is None or d + other_dist[neighbor] < best):
+                    best, meet = d + other_dist[neighbor], neighbor
+        frontiers[side] = next_frontier
+
+        if meet is not None:
+            if stats is not None:
+                stats["expanded"] = expanded
+            backward = reconstruct_path(parents[1], meet)
+            return reconstruct_path(parents[0], meet) + backward[-2::-1]
+
+    if stats is not None:
+        stats["expanded"] = expanded
+    return None
 
-    def dfs_recursive(state, path, depth):
-        if state == goal_state:
-            return path + [state]
-        if depth >= depth_limit:
-            return None
 
-        visited.add(state_to_tuple(state))
-        for neighbor in generate_neighbors(state):
-            t = state_to_tuple(neighbor)
-            if t not in visited:
-                result = dfs_recursive(neighbor, path + [state], depth + 1)
-                if result:
-                    return result
+def dfs(start_state, depth_limit=50, stats=None, table_limit=1_000_000):
+    # Iterative-deepening DFS on an explicit stack. Each iteration keeps a
+    # transposition table of the shallowest depth a state was reached at,
+    # so a state is only re-expanded when a shorter branch reaches it.
+    if stats is not None:
+        stats["expanded"] = 0
+        stats["iterations"] = []
+    if not is_solvable(start_state):
         return None
+    start = encode_state(start_state)
+
+    for limit in range(depth_limit + 1):
+        best_depth = {}
+        stack = [(start, 0)]
+        path = []  # current branch: path[d] is the state at depth d
+        expanded = 0
+        found = False
 
-    return dfs_recursive(start_state, [], 0)
+        while stack:
+            code, depth = stack.pop()
+            if best_depth.get(code, depth + 1) <= depth:
+                continue
+            if code in best_depth or len(best_depth) < table_limit:
+                best_depth[code] = depth
+            del path[depth:]
+            path.append(code)
+            if code == GOAL:
+                found = True
+                break
+            if depth < limit:
+                expanded += 1
+                # Reversed so children are explored in move order
+                for neighbor in reversed(generate_neighbors(code)):
+                    stack.append((neighbor, depth + 1))
+
+        if stats is not None:
+            stats["expanded"] += expanded
+            stats["iterations"].append(expanded)
+        if found:
+            return [decode_state(c) for c in path]
+    return None
+
+
+# ------------------------------
+# Precomputed distance table
+# ------------------------------
+# One byte per permutation of the 9 cells (indexed by Lehmer rank), holding
+# the exact number of moves to goal_state, or UNREACHABLE for the odd half.
+DISTANCE_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "AI_1_distances.bin")
+UNREACHABLE = 255
+FACTORIALS = [math.factorial(k) for k in range(9)]
+
+
+def rank_state(code):
+    rank = 0
+    used = 0
+    for k in range(9):
+        tile = (code >> (4 * k)) & 15
+        rank += bin(~used & ((1 << tile) - 1) & 511).count("1") * FACTORIALS[8 - k]
+        used |= 1 << tile
+    return rank
+
+
+def build_distance_table(path=DISTANCE_TABLE_PATH):
+    # Retrograde BFS from the goal over every solvable board
+    table = bytearray([UNREACHABLE]) * math.factorial(9)
+    table[rank_state(GOAL)] = 0
+    frontier = [GOAL]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for code in frontier:
+            for neighbor in generate_neighbors(code):
+                r = rank_state(neighbor)
+                if table[r] == UNREACHABLE:
+                    table[r] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    # Written under a temporary name so readers never map a partial file
+    with open(path + ".tmp", "wb") as f:
+        f.write(table)
+    os.replace(path + ".tmp", path)
+
+
+def load_distance_table(path=DISTANCE_TABLE_PATH):
+    if not os.path.exists(path):
+        build_distance_table(path)
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def solve_with_table(start_state, table):
+    if not is_solvable(start_state):
+        return None
+    code = encode_state(start_state)
+    path = [code]
+    dist = table[rank_state(code)]
+    # Every step downhill is one move closer to the goal
+    while dist > 0:
+        for neighbor in generate_neighbors(code):
+            if table[rank_state(neighbor)] == dist - 1:
+                code = neighbor
+                break
+        path.append(code)
+        dist -= 1
+    return [decode_state(c) for c in path]
 
 
 def print_solution(solution):
@@ -102,7 +300,10 @@ if __name__ == "__main__":
         print("\n--- 8 Puzzle Solver ---")
         print("1. Solve using BFS")
         print("2. Solve using DFS")
-        print("3. Exit")
+        print("3. Solve using Bidirectional BFS")
+        print("4. Solve using precomputed distance table")
+        print("5. Solve NxN puzzle (15-puzzle, 24-puzzle) using IDA*")
+        print("6. Exit")
 
         choice = input("Enter choice: ")
 
@@ -114,15 +315,35 @@ if __name__ == "__main__":
 
         elif choice == "2":
             start = input_state()
-            print("\nSolving with DFS...")
-            solution = dfs(start, depth_limit=50)
+            print("\nSolving with iterative-deepening DFS...")
+            stats = {}
+            solution = dfs(start, depth_limit=50, stats=stats)
+            for limit, expanded in enumerate(stats["iterations"]):
+                print(f"Depth limit {limit}: {expanded} nodes expanded")
             print_solution(solution)
 
         elif choice == "3":
+            start = input_state()
+            print("\nSolving with Bidirectional BFS...")
+            solution = bidirectional_bfs(start)
+            print_solution(solution)
+
+        elif choice == "4":
+            start = input_state()
+            print("\nLoading distance table (built on first use)...")
+            solution = solve_with_table(start, load_distance_table())
+            print_solution(solution)
+
+        elif choice == "5":
+            n = int(input("Board size N: "))
+            start = npuzzle.input_board(n)
+            print(f"\nSolving {n}x{n} puzzle with IDA*...")
+            solution = npuzzle.ida_star(start)
+            print_solution(solution)
+
+        elif choice == "6":
             print("Exiting...")
             break
 
         else:
             print("Invalid choice! Please try again.")
-explain the entire code and also give me theorotical
-
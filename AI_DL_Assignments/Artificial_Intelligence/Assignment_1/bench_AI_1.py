@@ -0,0 +1,101 @@
+# bench_AI_1.py
+#
+# Throughput benchmark for the 8-puzzle solvers in AI_1.py.
+# Usage: python bench_AI_1.py [num_boards] [scramble_moves]
+
+import copy
+import random
+import sys
+import time
+from collections import deque
+
+import AI_1
+
+# ------------------------------
+# Reference: original list-of-lists engine
+# ------------------------------
+
+def legacy_neighbors(state):
+    for i in range(3):
+        for j in range(3):
+            if state[i][j] == 0:
+                x, y = i, j
+    neighbors = []
+    for dx, dy in AI_1.moves:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < 3 and 0 <= ny < 3:
+            new_state = copy.deepcopy(state)
+            new_state[x][y], new_state[nx][ny] = new_state[nx][ny], new_state[x][y]
+            neighbors.append(new_state)
+    return neighbors
+
+
+def legacy_bfs(start_state, stats):
+    to_tuple = lambda s: tuple(tuple(row) for row in s)
+    visited = {to_tuple(start_state)}
+    queue = deque([(start_state, [])])
+    expanded = 0
+    while queue:
+        state, path = queue.popleft()
+        if state == AI_1.goal_state:
+            stats["expanded"] = expanded
+            return path + [state]
+        expanded += 1
+        for neighbor in legacy_neighbors(state):
+            t = to_tuple(neighbor)
+            if t not in visited:
+                visited.add(t)
+                queue.append((neighbor, path + [state]))
+    stats["expanded"] = expanded
+    return None
+
+
+# ------------------------------
+# Helpers
+# ------------------------------
+
+def random_board(scramble, rng):
+    # Random walk from the goal, so every board is solvable
+    code = AI_1.GOAL
+    for _ in range(scramble):
+        code = rng.choice(AI_1.generate_neighbors(code))
+    return AI_1.decode_state(code)
+
+
+def run(label, solver, boards):
+    expanded = 0
+    start = time.perf_counter()
+    for board in boards:
+        stats = {}
+        solver(board, stats=stats)
+        expanded += stats["expanded"]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}{expanded:>12}{elapsed:>10.3f}s{expanded / elapsed:>14,.0f}")
+    return expanded / elapsed
+
+
+def compare_bidirectional(boards):
+    # Both solvers must agree on the optimal path length
+    for board in boards:
+        assert len(AI_1.bfs(board)) == len(AI_1.bidirectional_bfs(board))
+    print(f"{'solver':<24}{'expanded':>12}{'time':>11}{'states/sec':>14}")
+    run("bfs", AI_1.bfs, boards)
+    run("bidirectional_bfs", AI_1.bidirectional_bfs, boards)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    scramble = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    rng = random.Random(0)
+    boards = [random_board(scramble, rng) for _ in range(count)]
+
+    print(f"{count} boards, {scramble}-move random walks from the goal\n")
+    print(f"{'solver':<24}{'expanded':>12}{'time':>11}{'states/sec':>14}")
+    before = run("bfs (list-of-lists)", lambda b, stats: legacy_bfs(b, stats), boards)
+    after = run("bfs (packed int)", AI_1.bfs, boards)
+    print(f"\nspeedup: {after / before:.1f}x\n")
+
+    # Long random walks give near-uniform solvable boards (~22 moves deep)
+    deep = [random_board(500, rng) for _ in range(count)]
+    print(f"{count} random solvable boards\n")
+    compare_bidirectional(deep)
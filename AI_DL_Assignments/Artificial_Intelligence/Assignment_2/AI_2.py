@@ -1,118 +1,583 @@
 # menu_csp_solver.py
 
-from collections import defaultdict, deque
-import copy
+from collections import OrderedDict, defaultdict, deque
+import heapq
+import sys
 
 # ------------------ CSP Framework ------------------
 
+def bits(mask):
+    # Yield the indices of the set bits of mask, lowest first
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def popcount(mask):
+    return bin(mask).count("1")
+
+# Compiled arc kinds: NEQ needs no table, TABLE holds a support matrix
+NEQ, TABLE = "neq", "table"
+
 class CSP:
     def __init__(self, variables, domains):
         self.variables = list(variables)
-        self.domains = {v: list(domains[v]) for v in self.variables}
+        # Every distinct value gets one bit; a domain is an int bitmask
+        self.values, self.bit = [], {}
+        for v in self.variables:
+            for val in domains[v]:
+                if val not in self.bit:
+                    self.bit[val] = len(self.values)
+                    self.values.append(val)
+        self.domains = {v: self.to_mask(domains[v]) for v in self.variables}
+        # Binary constraints as given, keyed (xi, xj) -> [fn(vi, vj), ...]
         self.constraints = defaultdict(list)
+        # Compiled arc table (xi, xj) -> (kind, support), built by compile()
+        self.arcs = None
         self.neighbors = defaultdict(set)
+        # Binary arcs only, and n-ary all-different groups (tuples of vars)
+        self.arc_neighbors = defaultdict(set)
+        self.alldiffs = []
+        self.var_alldiffs = defaultdict(list)
+        self.alldiff_neighbors = defaultdict(set)
+        # Explanations: reasons[v] is a bitmask over variable positions of
+        # the assignments that caused every pruning of v so far, and
+        # conflict explains the last failure found by ac3
+        self.index = {v: i for i, v in enumerate(self.variables)}
+        self.reasons = {v: 0 for v in self.variables}
+        self.conflict = 0
+        # (var, previous mask, previous reasons) for every domain change,
+        # undone on backtrack
+        self.trail = []
+        # Variable-ordering queue, notified of domain changes during search
+        self.mrv = None
+
+    def to_mask(self, values):
+        mask = 0
+        for val in values:
+            mask |= 1 << self.bit[val]
+        return mask
+
+    def domain_values(self, var):
+        return [self.values[b] for b in bits(self.domains[var])]
+
+    def domain_size(self, var):
+        return popcount(self.domains[var])
+
+    def prune(self, var, mask, reason=0):
+        self.trail.append((var, self.domains[var], self.reasons[var]))
+        self.domains[var] = mask
+        self.reasons[var] |= reason
+        if self.mrv is not None:
+            self.mrv.push(var)
+
+    def undo(self, mark):
+        # Restore every domain changed since len(self.trail) was mark
+        trail, domains, reasons, mrv = self.trail, self.domains, self.reasons, self.mrv
+        while len(trail) > mark:
+            var, mask, reason = trail.pop()
+            domains[var] = mask
+            reasons[var] = reason
+            if mrv is not None:
+                mrv.push(var)
 
     def add_constraint(self, xi, xj, constraint_fn):
-        self.constraints[xi].append((xj, constraint_fn))
-        self.constraints[xj].append((xi, lambda y, x: constraint_fn(x, y)))
+        self.constraints[(xi, xj)].append(constraint_fn)
+        self.arcs = None
         self.neighbors[xi].add(xj)
         self.neighbors[xj].add(xi)
+        self.arc_neighbors[xi].add(xj)
+        self.arc_neighbors[xj].add(xi)
+
+    def add_alldiff(self, group):
+        # All variables in group take pairwise different values
+        group = tuple(group)
+        index = len(self.alldiffs)
+        self.alldiffs.append(group)
+        for v in group:
+            self.var_alldiffs[v].append(index)
+            others = set(group) - {v}
+            self.neighbors[v] |= others
+            self.alldiff_neighbors[v] |= others
+
+    def compile(self):
+        # Evaluate every binary constraint once over the domains and keep
+        # one support matrix per arc: support[b] is the mask of xj values
+        # compatible with value bit b of xi. Pure inequalities become NEQ.
+        tables = {}
+        for (xi, xj), fns in self.constraints.items():
+            forward = tables.setdefault((xi, xj), {})
+            backward = tables.setdefault((xj, xi), {})
+            for bi in bits(self.domains[xi]):
+                vi = self.values[bi]
+                for bj in bits(self.domains[xj]):
+                    ok = all(fn(vi, self.values[bj]) for fn in fns)
+                    # Arcs posted in both directions are intersected
+                    forward[bi] = forward.get(bi, -1) & (-1 if ok else ~(1 << bj))
+                    backward[bj] = backward.get(bj, -1) & (-1 if ok else ~(1 << bi))
+        self.arcs = {}
+        for (xi, xj), rows in tables.items():
+            dom_i, dom_j = self.domains[xi], self.domains[xj]
+            support = [0] * len(self.values)
+            for bi in bits(dom_i):
+                support[bi] = rows.get(bi, -1) & dom_j
+            if all(support[bi] == dom_j & ~(1 << bi) for bi in bits(dom_i)):
+                self.arcs[(xi, xj)] = (NEQ, None)
+            else:
+                self.arcs[(xi, xj)] = (TABLE, support)
+        # Variables whose every arc is an inequality get the cheap LCV count
+        self.neq_only = {v for v in self.variables
+                         if all(self.arcs[(v, nbr)][0] is NEQ for nbr in self.arc_neighbors[v])}
 
     def is_consistent(self, var, assignment):
+        if self.arcs is None:
+            self.compile()
         val = assignment[var]
-        for (nbr, fn) in self.constraints[var]:
-            if nbr in assignment and not fn(val, assignment[nbr]):
+        b = self.bit[val]
+        for nbr in self.arc_neighbors[var]:
+            if nbr in assignment:
+                kind, support = self.arcs[(var, nbr)]
+                other = assignment[nbr]
+                if (other == val) if kind is NEQ else not support[b] >> self.bit[other] & 1:
+                    return False
+        for nbr in self.alldiff_neighbors[var]:
+            if nbr in assignment and assignment[nbr] == val:
                 return False
         return True
 
 # ------------------ Inference: AC-3 ------------------
 
-def ac3(csp, queue=None):
+def ac3(csp, queue=None, groups=None):
+    # Arcs are revised first; all-different groups touching a changed
+    # variable are queued once and propagated when the arc queue drains.
+    # On failure csp.conflict explains the wipeout.
+    if csp.arcs is None:
+        csp.compile()
     if queue is None:
-        queue = deque((xi, xj) for xi in csp.variables for (xj, _) in csp.constraints[xi])
+        queue = deque(csp.arcs)
+        groups = range(len(csp.alldiffs))
+    groups = deque(groups or ())
+    queued = set(groups)
 
-    while queue:
-        xi, xj = queue.popleft()
-        if revise(csp, xi, xj):
+    while queue or groups:
+        if queue:
+            xi, xj = queue.popleft()
+            if not revise(csp, xi, xj):
+                continue
+            changed, source = [xi], None
+        else:
+            source = groups.popleft()
+            queued.discard(source)
+            changed = propagate_alldiff(csp, csp.alldiffs[source])
+            if changed is None:
+                return False
+            xj = None
+        for xi in changed:
             if not csp.domains[xi]:
+                csp.conflict = csp.reasons[xi]
                 return False
-            for xk in csp.neighbors[xi]:
+            for xk in csp.arc_neighbors[xi]:
                 if xk != xj:
                     queue.append((xk, xi))
+            for g in csp.var_alldiffs[xi]:
+                if g != source and g not in queued:
+                    queued.add(g)
+                    groups.append(g)
     return True
 
 def revise(csp, xi, xj):
-    revised = False
-    fns = [fn for (nbr, fn) in csp.constraints[xi] if nbr == xj]
-    new_domain = []
-    for vi in csp.domains[xi]:
-        if any(all(fn(vi, vj) for fn in fns) for vj in csp.domains[xj]):
-            new_domain.append(vi)
-        else:
-            revised = True
-    if revised:
-        csp.domains[xi] = new_domain
-    return revised
+    kind, support = csp.arcs[(xi, xj)]
+    domain = csp.domains[xi]
+    dom_j = csp.domains[xj]
+    if kind is NEQ:
+        # Only a fixed xj can take away a value from xi
+        if dom_j & (dom_j - 1) or not domain & dom_j:
+            return False
+        new_domain = domain & ~dom_j
+    else:
+        new_domain = domain
+        for b in bits(domain):
+            if not support[b] & dom_j:
+                new_domain &= ~(1 << b)
+        if new_domain == domain:
+            return False
+    # Whatever narrowed xj is also why xi lost these values
+    csp.prune(xi, new_domain, csp.reasons[xj])
+    return True
+
+# ------------------ Inference: All-Different ------------------
+
+def propagate_alldiff(csp, group):
+    # Prune one all-different group to a fixpoint. Returns the variables
+    # whose domains shrank, or None if the group cannot be satisfied.
+    # Every pruning and failure is explained by the whole group's reasons.
+    doms = [csp.domains[v] for v in group]
+    k = len(doms)
+    union = reason = 0
+    for v, d in zip(group, doms):
+        union |= d
+        reason |= csp.reasons[v]
+    csp.conflict = reason
+    if popcount(union) < k:
+        return None
+
+    # Naked singles: a fixed value is removed from every other variable.
+    # Hidden singles: in a tight group every value must be used, so a value
+    # with one possible home is placed there.
+    tight = popcount(union) == k
+    progress = True
+    while progress:
+        progress = False
+        for i in range(k):
+            d = doms[i]
+            if d and not d & (d - 1):
+                for j in range(k):
+                    if j != i and doms[j] & d:
+                        doms[j] &= ~d
+                        if not doms[j]:
+                            return None
+                        progress = True
+        if tight:
+            for b in bits(union):
+                value = 1 << b
+                homes = [i for i in range(k) if doms[i] & value]
+                if not homes:
+                    return None
+                if len(homes) == 1 and doms[homes[0]] != value:
+                    doms[homes[0]] = value
+                    progress = True
+
+    # The singles are already complete unless some unfixed variable has
+    # fewer values than there are unfixed variables: with every one of
+    # them keeping at least that many, no Hall set exists besides the
+    # fixed variables, and the matching below would prune nothing
+    unfixed = [d for d in doms if d & (d - 1)]
+    if any(popcount(d) < len(unfixed) for d in unfixed):
+        doms = hall_filter(doms, union)
+        if doms is None:
+            return None
+    changed = []
+    for v, d in zip(group, doms):
+        if d != csp.domains[v]:
+            csp.prune(v, d, reason)
+            changed.append(v)
+    return changed
+
+def hall_filter(doms, union):
+    # Hall sets via maximum matching (Regin): an edge var->value survives
+    # only if it is matched, reachable by an alternating path from a free
+    # value, or lies on an alternating cycle. Returns the filtered
+    # domains, or None if no matching covers every variable.
+    k = len(doms)
+    match = [0] * k   # matched value bit per variable
+    owner = {}        # value bit -> variable
+
+    def augment(i, seen):
+        for b in bits(doms[i] & ~seen[0]):
+            value = 1 << b
+            seen[0] |= value
+            if value not in owner or augment(owner[value], seen):
+                match[i] = value
+                owner[value] = i
+                return True
+        return False
+
+    for i in range(k):
+        if not augment(i, [0]):
+            return None
+
+    matched = 0
+    for value in match:
+        matched |= value
+    reachable = union & ~matched  # free values
+    grew = True
+    while grew:
+        grew = False
+        for i in range(k):
+            if doms[i] & reachable and not match[i] & reachable:
+                reachable |= match[i]
+                grew = True
+
+    # reach[i]: variables whose matched value i can take (transitively)
+    reach = [sum(1 << j for j in range(k) if j != i and doms[i] & match[j]) for i in range(k)]
+    for m in range(k):
+        for i in range(k):
+            if reach[i] >> m & 1:
+                reach[i] |= reach[m]
+    filtered = []
+    for i in range(k):
+        keep = match[i] | (doms[i] & reachable)
+        for j in bits(reach[i]):
+            if reach[j] >> i & 1:
+                keep |= match[j]
+        filtered.append(keep & doms[i])
+    return filtered
 
 # ------------------ Heuristics ------------------
 
+class MRVQueue:
+    # Unassigned variables bucketed by domain size. Each bucket is a heap
+    # ordered by (-degree, declaration order), so the front of the smallest
+    # non-empty bucket is exactly min(unassigned, key=(size, -degree)).
+    # bucket[var] is the bucket holding var's live entry; a variable is
+    # pushed only when its domain size moves it to another bucket, and the
+    # entry it leaves behind is dropped lazily when it surfaces or when
+    # the bucket is compacted.
+    def __init__(self, csp, assignment):
+        self.csp = csp
+        self.assignment = assignment
+        self.rank = {v: (-len(csp.neighbors[v]), i, v) for i, v in enumerate(csp.variables)}
+        self.buckets = [[] for _ in range(len(csp.values) + 1)]
+        self.live = [0] * len(self.buckets)  # live entries per bucket
+        self.bucket = {}
+        for v in csp.variables:
+            self.push(v)
+
+    def push(self, var):
+        if var in self.assignment:
+            return  # pushed again once it is unassigned
+        size = popcount(self.csp.domains[var])
+        old = self.bucket.get(var)
+        if old == size:
+            return
+        if old is not None:
+            self.live[old] -= 1
+            if len(self.buckets[old]) > 2 * self.live[old] + 16:
+                self.compact(old)
+        self.bucket[var] = size
+        self.live[size] += 1
+        heapq.heappush(self.buckets[size], self.rank[var])
+
+    def compact(self, size):
+        # Keep one entry per variable still live in this bucket
+        bucket = self.bucket
+        heap = list({entry for entry in self.buckets[size] if bucket.get(entry[2]) == size})
+        heapq.heapify(heap)
+        self.buckets[size] = heap
+
+    def select(self):
+        assignment, bucket = self.assignment, self.bucket
+        for size, heap in enumerate(self.buckets):
+            while heap:
+                var = heap[0][2]
+                if bucket.get(var) == size:
+                    if var not in assignment:
+                        return var
+                    # Assigned: forget the entry, push(var) re-adds it later
+                    del bucket[var]
+                    self.live[size] -= 1
+                heapq.heappop(heap)
+        return None
+
 def select_unassigned_variable(assignment, csp):
+    if csp.mrv is not None:
+        return csp.mrv.select()
     unassigned = [v for v in csp.variables if v not in assignment]
-    return min(unassigned, key=lambda v: (len(csp.domains[v]), -len(csp.neighbors[v])))
+    return min(unassigned, key=lambda v: (csp.domain_size(v), -len(csp.neighbors[v])))
 
 def order_domain_values(var, assignment, csp):
-    counts = []
-    for val in csp.domains[var]:
-        count = 0
+    # Least constraining value: count the neighbour values each choice rules out
+    domain = csp.domains[var]
+    if not domain & (domain - 1):
+        return csp.domain_values(var)  # a single value needs no ordering
+    counts = {}
+    if var in csp.neq_only:
+        # Inequality-only neighbours rule out just the value itself, so one
+        # pass over the shared bits counts every value at once
         for nbr in csp.neighbors[var]:
-            if nbr in assignment: continue
-            fns = [fn for (n, fn) in csp.constraints[var] if n == nbr]
-            for val2 in csp.domains[nbr]:
-                if not all(fn(val, val2) for fn in fns):
-                    count += 1
-        counts.append((count, val))
-    counts.sort()
-    return [val for (_, val) in counts]
+            if nbr not in assignment:
+                for b in bits(csp.domains[nbr] & domain):
+                    counts[b] = counts.get(b, 0) + 1
+    else:
+        nbrs = [nbr for nbr in csp.neighbors[var] if nbr not in assignment]
+        for b in bits(domain):
+            value = 1 << b
+            count = 0
+            for nbr in nbrs:
+                dom = csp.domains[nbr]
+                ruled_out = dom & value if nbr in csp.alldiff_neighbors[var] else 0
+                if nbr in csp.arc_neighbors[var]:
+                    kind, support = csp.arcs[(var, nbr)]
+                    ruled_out |= dom & (value if kind is NEQ else ~support[b])
+                count += popcount(ruled_out)
+            counts[b] = count
+    ranked = sorted((counts.get(b, 0), csp.values[b]) for b in bits(domain))
+    return [val for (_, val) in ranked]
+
+# ------------------ Nogood Learning ------------------
+
+class NogoodStore:
+    # Learned nogoods: sets of (var, value) assignments that cannot all
+    # hold in any solution. Each nogood is indexed under every literal, and
+    # once capacity is reached the least recently used one is evicted.
+    def __init__(self, csp, capacity=10000, max_size=16):
+        self.csp = csp
+        self.capacity = capacity
+        self.max_size = max_size
+        self.nogoods = OrderedDict()   # frozenset of literals -> var bitmask
+        self.watch = defaultdict(set)  # literal -> nogoods containing it
+
+    def add(self, conflict, assignment):
+        if not conflict or popcount(conflict) > self.max_size:
+            return
+        variables = self.csp.variables
+        nogood = frozenset((variables[i], assignment[variables[i]]) for i in bits(conflict))
+        if nogood in self.nogoods:
+            return
+        if len(self.nogoods) >= self.capacity:
+            old, _ = self.nogoods.popitem(last=False)
+            for literal in old:
+                self.watch[literal].discard(old)
+        self.nogoods[nogood] = conflict
+        for literal in nogood:
+            self.watch[literal].add(nogood)
+
+    def violated(self, var, value, assignment):
+        # Explanation of a nogood completed by var=value, or 0 if none is
+        for nogood in self.watch.get((var, value), ()):
+            if all(assignment.get(v) == val for v, val in nogood):
+                self.nogoods.move_to_end(nogood)
+                return self.nogoods[nogood]
+        return 0
 
 # ------------------ Backtracking ------------------
 
-def backtracking_search(csp):
-    csp = copy.deepcopy(csp)
-    if not ac3(csp):  # preprocess
-        return None
+class SearchLimitReached(Exception):
+    pass
+
+def backtracking_search(csp, stats=None, lcv=True, rng=None, node_limit=None,
+                        backjump=True, nogood_limit=0):
+    # Domains are narrowed in place and restored from the trail on the way
+    # out, so the caller's CSP is left unchanged without copying it.
+    # lcv=False tries values in domain order, rng shuffles them, and
+    # node_limit gives up (stats["limit_reached"]) after that many nodes.
+    # backjump=False backtracks chronologically; nogood_limit > 0 keeps
+    # that many learned nogoods.
+    nodes = backtracks = backjumps = 0
+    store = NogoodStore(csp, nogood_limit) if nogood_limit > 0 else None
 
     def backtrack(assignment):
+        # Returns (solution, conflict), where conflict is the bitmask of
+        # assigned variables whose values together explain the failure
+        nonlocal nodes, backtracks, backjumps
         if len(assignment) == len(csp.variables):
-            return assignment
+            return assignment, 0
         var = select_unassigned_variable(assignment, csp)
-        for value in order_domain_values(var, assignment, csp):
+        var_bit = 1 << csp.index[var]
+        conflict = csp.reasons[var]  # why values are already missing
+        values = order_domain_values(var, assignment, csp) if lcv else csp.domain_values(var)
+        if rng is not None:
+            rng.shuffle(values)
+        for position, value in enumerate(values, 1):
             assignment[var] = value
-            if csp.is_consistent(var, assignment):
-                saved_domains = {v: list(csp.domains[v]) for v in csp.variables}
-                csp.domains[var] = [value]
-                if ac3(csp, deque((nbr, var) for nbr in csp.neighbors[var])):
-                    result = backtrack(assignment)
-                    if result: return result
-                csp.domains = saved_domains
+            nodes += 1
+            if node_limit is not None and nodes > node_limit:
+                raise SearchLimitReached
+            failure = 0
+            if not csp.is_consistent(var, assignment):
+                failure = var_bit
+                for nbr in csp.neighbors[var]:
+                    if nbr in assignment:
+                        failure |= 1 << csp.index[nbr]
+            elif store is not None:
+                failure = store.violated(var, value, assignment)
+            if not failure:
+                mark = len(csp.trail)
+                csp.prune(var, 1 << csp.bit[value], var_bit)
+                if ac3(csp, deque((nbr, var) for nbr in csp.arc_neighbors[var]), csp.var_alldiffs[var]):
+                    result, failure = backtrack(assignment)
+                    if result: return result, 0
+                else:
+                    failure = csp.conflict
+                csp.undo(mark)
             del assignment[var]
-        return None
+            csp.mrv.push(var)
+            backtracks += 1
+            if backjump and not failure & var_bit:
+                # The failure does not depend on var, so no other value of
+                # var can fix it: jump straight back past this level
+                if position < len(values):
+                    backjumps += 1
+                return None, failure
+            conflict |= failure & ~var_bit
+        if store is not None:
+            store.add(conflict, assignment)
+        return None, conflict
 
-    return backtrack({})
+    # One stack frame per assigned variable
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), len(csp.variables) + 1000))
+    mark = len(csp.trail)
+    limit_reached = False
+    try:
+        if not ac3(csp):  # preprocess
+            return None
+        assignment = {}
+        csp.mrv = MRVQueue(csp, assignment)
+        return backtrack(assignment)[0]
+    except SearchLimitReached:
+        limit_reached = True
+        return None
+    finally:
+        csp.mrv = None
+        csp.undo(mark)
+        if stats is not None:
+            stats["nodes"], stats["backtracks"] = nodes, backtracks
+            stats["backjumps"] = backjumps
+            stats["nogoods"] = len(store.nogoods) if store is not None else 0
+            stats["limit_reached"] = limit_reached
 
 # ------------------ Example Problems ------------------
 
-def australia_map_coloring():
+def add_groups(csp, groups, pairwise=False):
+    # Post each group as one all-different, or as pairwise != arcs
+    def neq(a,b): return a != b
+    for group in groups:
+        group = list(group)
+        if not pairwise:
+            csp.add_alldiff(group)
+            continue
+        for i in range(len(group)):
+            for j in range(i+1, len(group)):
+                if group[j] not in csp.neighbors[group[i]]:
+                    csp.add_constraint(group[i], group[j], neq)
+
+def australia_csp(pairwise=False):
     vars = ['WA','NT','SA','Q','NSW','V','T']
     colors = ['red','green','blue']
     domains = {v: colors for v in vars}
     csp = CSP(vars, domains)
-    edges = [('WA','NT'),('WA','SA'),('NT','SA'),('NT','Q'),
-             ('SA','Q'),('SA','NSW'),('SA','V'),('Q','NSW'),('NSW','V')]
-    for a,b in edges:
-        csp.add_constraint(a,b, lambda x,y: x!=y)
-    sol = backtracking_search(csp)
+    # Mutually adjacent regions; together they cover every border
+    cliques = [('WA','NT','SA'),('NT','SA','Q'),('SA','Q','NSW'),('SA','NSW','V')]
+    add_groups(csp, cliques, pairwise)
+    return csp
+
+def australia_map_coloring():
+    sol = backtracking_search(australia_csp())
     print("Australia Map Coloring Solution:", sol)
 
+def parse_sudoku(line):
+    # 81 characters, row by row, with '0' or '.' for an empty cell
+    line = line.strip()
+    if len(line) != 81:
+        raise ValueError("A Sudoku line must have exactly 81 characters.")
+    return [[0 if ch in ".0" else int(ch) for ch in line[r * 9:(r + 1) * 9]] for r in range(9)]
+
+def sudoku_csp(puzzle, pairwise=False):
+    vars, domains = [], {}
+    for r in range(9):
+        for c in range(9):
+            name = f'r{r}c{c}'
+            vars.append(name)
+            domains[name] = [puzzle[r][c]] if puzzle[r][c] != 0 else list(range(1,10))
+    csp = CSP(vars, domains)
+
+    units = [[f'r{r}c{c}' for c in range(9)] for r in range(9)]
+    units += [[f'r{r}c{c}' for r in range(9)] for c in range(9)]
+    units += [[f'r{br*3+dr}c{bc*3+dc}' for dr in range(3) for dc in range(3)]
+              for br in range(3) for bc in range(3)]
+    add_groups(csp, units, pairwise)
+    return csp
+
 def sudoku():
     puzzle = [
         [5,3,0,0,7,0,0,0,0],
@@ -126,32 +591,7 @@ def sudoku():
         [0,0,0,0,8,0,0,7,9]
     ]
 
-    vars, domains = [], {}
-    for r in range(9):
-        for c in range(9):
-            name = f'r{r}c{c}'
-            vars.append(name)
-            domains[name] = [puzzle[r][c]] if puzzle[r][c] != 0 else list(range(1,10))
-    csp = CSP(vars, domains)
-
-    def neq(a,b): return a != b
-    for r in range(9):
-        for c1 in range(9):
-            for c2 in range(c1+1,9):
-                csp.add_constraint(f'r{r}c{c1}', f'r{r}c{c2}', neq)
-    for c in range(9):
-        for r1 in range(9):
-            for r2 in range(r1+1,9):
-                csp.add_constraint(f'r{r1}c{c}', f'r{r2}c{c}', neq)
-    for br in range(3):
-        for bc in range(3):
-            cells = [(br*3+dr, bc*3+dc) for dr in range(3) for dc in range(3)]
-            for i in range(9):
-                for j in range(i+1,9):
-                    r1,c1 = cells[i]; r2,c2 = cells[j]
-                    csp.add_constraint(f'r{r1}c{c1}', f'r{r2}c{c2}', neq)
-
-    sol = backtracking_search(csp)
+    sol = backtracking_search(sudoku_csp(puzzle))
     print("Sudoku Solution:")
     if sol:
         for r in range(9):
@@ -179,5 +619,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-explain the code and give me throutical explanation
-
@@ -0,0 +1,134 @@
+# bench_AI_2.py
+#
+# Node throughput of the CSP backtracking solver on hard 9x9 Sudokus,
+# an AC-3 microbenchmark on the Sudoku and Australia instances, large
+# generated map-coloring instances, and chronological backtracking vs
+# conflict-directed backjumping on random 3-coloring near the phase transition.
+# Usage: python bench_AI_2.py [puzzle_file]
+
+import os
+import random
+import sys
+import time
+
+import AI_2
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def solve_corpus(path):
+    print(f"{'puzzle':<24}{'nodes':>10}{'backtracks':>12}{'time':>10}{'nodes/sec':>12}")
+    total_nodes = total_time = 0
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            csp = AI_2.sudoku_csp(AI_2.parse_sudoku(line))
+            stats = {}
+            start = time.perf_counter()
+            solution = AI_2.backtracking_search(csp, stats)
+            elapsed = time.perf_counter() - start
+            assert solution is not None, line
+            total_nodes += stats["nodes"]
+            total_time += elapsed
+            print(f"{line[:20] + '...':<24}{stats['nodes']:>10}{stats['backtracks']:>12}"
+                  f"{elapsed:>9.3f}s{stats['nodes'] / elapsed:>12,.0f}")
+    print(f"{'total':<24}{total_nodes:>10}{'':>12}{total_time:>9.3f}s{total_nodes / total_time:>12,.0f}")
+
+
+def time_ac3(label, csp, repeats):
+    AI_2.ac3(csp)  # compiles the arc table
+    csp.undo(0)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        AI_2.ac3(csp)
+        csp.undo(0)
+    elapsed = (time.perf_counter() - start) / repeats
+    print(f"{label:<32}{len(csp.arcs):>8}{len(csp.alldiffs):>8}{elapsed * 1e6:>14,.1f}")
+
+
+def ac3_microbenchmark(path):
+    with open(path) as f:
+        puzzle = AI_2.parse_sudoku(f.readline())
+    print(f"{'instance':<32}{'arcs':>8}{'groups':>8}{'us per AC-3':>14}")
+    time_ac3("sudoku (pairwise !=)", AI_2.sudoku_csp(puzzle, pairwise=True), 50)
+    time_ac3("sudoku (all-different)", AI_2.sudoku_csp(puzzle), 50)
+    time_ac3("australia (pairwise !=)", AI_2.australia_csp(pairwise=True), 5000)
+    time_ac3("australia (all-different)", AI_2.australia_csp(), 5000)
+
+
+def grid_map_csp(side, colors=4):
+    # Triangulated side x side grid: planar, so 4 colors always suffice
+    regions = [f"m{r}_{c}" for r in range(side) for c in range(side)]
+    csp = AI_2.CSP(regions, {v: list(range(colors)) for v in regions})
+    borders = []
+    for r in range(side):
+        for c in range(side):
+            for dr, dc in ((0, 1), (1, 0), (1, 1)):
+                if r + dr < side and c + dc < side:
+                    borders.append((f"m{r}_{c}", f"m{r + dr}_{c + dc}"))
+    AI_2.add_groups(csp, borders, pairwise=True)
+    return csp
+
+
+def map_coloring_benchmark(sides=(20, 40, 60)):
+    print(f"{'regions':<24}{'nodes':>10}{'backtracks':>12}{'time':>10}{'nodes/sec':>12}")
+    for side in sides:
+        csp = grid_map_csp(side)
+        stats = {}
+        start = time.perf_counter()
+        assert AI_2.backtracking_search(csp, stats) is not None
+        elapsed = time.perf_counter() - start
+        print(f"{side * side:<24}{stats['nodes']:>10}{stats['backtracks']:>12}"
+              f"{elapsed:>9.3f}s{stats['nodes'] / elapsed:>12,.0f}")
+
+
+def random_coloring_csp(n, edges, colors, seed):
+    # Random graph with the given edge count; for 3 colors, about 2.3 edges
+    # per node is where instances switch from colorable to not
+    rng = random.Random(seed)
+    nodes = [f"v{i}" for i in range(n)]
+    csp = AI_2.CSP(nodes, {v: list(range(colors)) for v in nodes})
+    chosen = set()
+    while len(chosen) < edges:
+        a, b = sorted(rng.sample(range(n), 2))
+        chosen.add((a, b))
+    AI_2.add_groups(csp, [(nodes[a], nodes[b]) for a, b in sorted(chosen)], pairwise=True)
+    return csp
+
+
+def phase_transition_benchmark(n=150, ratio=2.3, colors=3, count=20):
+    variants = [("chronological", {"backjump": False}),
+                ("backjumping", {}),
+                ("backjumping+nogoods", {"nogood_limit": 10000})]
+    print(f"{count} random graphs, {n} nodes, {int(n * ratio)} edges, {colors} colors\n")
+    print(f"{'solver':<24}{'solved':>8}{'nodes':>10}{'backtracks':>12}{'backjumps':>11}{'time':>10}")
+    outcomes = []
+    for label, options in variants:
+        solved = nodes = backtracks = backjumps = 0
+        found = []
+        start = time.perf_counter()
+        for seed in range(count):
+            stats = {}
+            solution = AI_2.backtracking_search(random_coloring_csp(n, int(n * ratio), colors, seed),
+                                                stats, **options)
+            found.append(solution is not None)
+            solved += solution is not None
+            nodes += stats["nodes"]
+            backtracks += stats["backtracks"]
+            backjumps += stats["backjumps"]
+        elapsed = time.perf_counter() - start
+        outcomes.append(found)
+        print(f"{label:<24}{solved:>8}{nodes:>10}{backtracks:>12}{backjumps:>11}{elapsed:>9.2f}s")
+    assert all(found == outcomes[0] for found in outcomes), "solvers disagree on satisfiability"
+
+
+if __name__ == "__main__":
+    corpus = sys.argv[1] if len(sys.argv) > 1 else os.path.join(HERE, "hard_sudoku.txt")
+    solve_corpus(corpus)
+    print()
+    ac3_microbenchmark(corpus)
+    print()
+    map_coloring_benchmark()
+    print()
+    phase_transition_benchmark()
@@ -0,0 +1,134 @@
+# sudoku_batch.py
+#
+# Streaming batch solver for Sudoku files in the standard one-puzzle-per-line
+# format (81 characters, '.' or '0' for blanks, '#' lines ignored). Puzzles
+# are read lazily, solved in chunks across a process pool, and written back
+# in input order as JSON lines with per-puzzle stats.
+#
+# With --portfolio, a puzzle that exceeds the node budget of the default
+# heuristics is restarted under a rotating set of configurations with a
+# doubling budget, and the first configuration to finish wins.
+#
+# Usage: python sudoku_batch.py puzzles.txt --workers 8 --portfolio > out.jsonl
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import AI_2
+
+# (name, backtracking_search options); a "seed" option means a shuffled
+# value order seeded per puzzle and round
+PORTFOLIO = [
+    ("mrv+lcv", {}),
+    ("mrv+domain-order", {"lcv": False}),
+    ("mrv+random", {"lcv": False, "seed": 1}),
+]
+
+# ------------------ Solving ------------------
+
+def grid_to_line(solution):
+    return "".join(str(solution[f'r{r}c{c}']) for r in range(9) for c in range(9))
+
+def solve_with_portfolio(csp, index, budget, portfolio):
+    # Rotate through the configurations, doubling the node budget after
+    # each full round, until one solves the puzzle or proves it unsolvable
+    total = {"nodes": 0, "backtracks": 0}
+    configs = PORTFOLIO if portfolio else PORTFOLIO[:1]
+    limit = budget if portfolio else None
+    round_no = 0
+    while True:
+        for position, (name, options) in enumerate(configs):
+            options = dict(options)
+            if "seed" in options:
+                options["rng"] = random.Random(options.pop("seed") * 1_000_003 + index * 101 + round_no)
+            stats = {}
+            solution = AI_2.backtracking_search(csp, stats, node_limit=limit, **options)
+            total["nodes"] += stats["nodes"]
+            total["backtracks"] += stats["backtracks"]
+            if not stats["limit_reached"]:
+                total["config"] = name
+                total["restarts"] = round_no * len(configs) + position
+                return solution, total
+        round_no += 1
+        limit *= 2
+
+def _solve_chunk(chunk, budget, portfolio):
+    results = []
+    for index, line in chunk:
+        record = {"id": index, "puzzle": line}
+        began = time.perf_counter()
+        try:
+            csp = AI_2.sudoku_csp(AI_2.parse_sudoku(line))
+        except ValueError as exc:
+            record["error"] = str(exc)
+        else:
+            solution, stats = solve_with_portfolio(csp, index, budget, portfolio)
+            record["solution"] = grid_to_line(solution) if solution else None
+            record.update(stats)
+        record["seconds"] = round(time.perf_counter() - began, 6)
+        results.append(record)
+    return results
+
+# ------------------ Batch API ------------------
+
+def read_puzzles(lines):
+    # Lazily yield (index, puzzle) for every non-blank, non-comment line
+    index = 0
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield index, line
+            index += 1
+
+def solve_puzzles(lines, workers=None, chunksize=64, portfolio=False, budget=2000):
+    """
+    Yield one result dict per puzzle, in input order. Only a few chunks per
+    worker are in flight at once, so input of any length is streamed.
+    """
+    if budget < 1:
+        raise ValueError(f"The node budget must be at least 1, got {budget}.")
+    workers = workers or os.cpu_count() or 1
+    puzzles = read_puzzles(lines)
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < 4 * workers:
+                chunk = list(islice(puzzles, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_solve_chunk, chunk, budget, portfolio))
+            if not pending:
+                break
+            yield from pending.popleft().result()
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a file of 81-character Sudoku lines in parallel.")
+    parser.add_argument("input", help="puzzle file, or - for stdin")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=64)
+    parser.add_argument("--portfolio", action="store_true",
+                        help="restart hard puzzles under rotating heuristic configurations")
+    parser.add_argument("--budget", type=positive_int, default=2000,
+                        help="nodes before the first portfolio restart (doubles every round)")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    with source:
+        for record in solve_puzzles(source, args.workers, args.chunksize, args.portfolio, args.budget):
+            print(json.dumps(record), flush=True)
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,8 @@
+import csv
+import functools
+
+import datalog
+
 facts = {
     "parent": [
         ("john", "mary"),
@@ -9,58 +14,208 @@ facts = {
     ]
 }
 
+# Recursive relations, derived bottom-up from the parent facts
+FAMILY_RULES = [
+    "ancestor(X, Y) :- parent(X, Y).",
+    "ancestor(X, Y) :- parent(X, Z), ancestor(Z, Y).",
+    "descendant(X, Y) :- ancestor(Y, X).",
+]
+
+@functools.lru_cache(maxsize=None)
+def cousin_rules(k):
+    # k-th cousins share an ancestor k+1 generations up and none closer
+    # (0th cousins are siblings, 1st cousins share a grandparent)
+    rules = ["ancestor_at_1(A, X) :- parent(A, X)."]
+    rules += [f"ancestor_at_{d}(A, X) :- parent(A, Z), ancestor_at_{d - 1}(Z, X)." for d in range(2, k + 2)]
+    rules += [f"closer_{k}(X, Y) :- ancestor_at_{d}(A, X), ancestor_at_{d}(A, Y)." for d in range(1, k + 1)]
+    cousin = f"cousin_{k}(X, Y) :- ancestor_at_{k + 1}(A, X), ancestor_at_{k + 1}(A, Y), X != Y"
+    rules.append(cousin + (f", not closer_{k}(X, Y)." if k else "."))
+    return tuple(rules)
+
+# ----------------- Fact Store -----------------
+class FactStore:
+    # People are interned to integer ids; parent facts are indexed in both
+    # directions (id -> set of children, id -> set of parents), so every
+    # query costs time proportional to its answer, not to the fact count
+    def __init__(self, parent_facts=()):
+        self.ids = {}
+        self.names = []
+        self.children = []
+        self.parents = []
+        # Derived relations over the same ids, materialized on first use;
+        # facts added after that are queued and applied incrementally
+        self.program = None
+        self.pending = []
+        self.rules = set()
+        for parent, child in parent_facts:
+            self.add_parent(parent, child)
+
+    def intern(self, name):
+        pid = self.ids.get(name)
+        if pid is None:
+            pid = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.children.append(set())
+            self.parents.append(set())
+        return pid
+
+    def add_parent(self, parent, child):
+        # Returns False if the fact was already known
+        p, c = self.intern(parent), self.intern(child)
+        if c in self.children[p]:
+            return False
+        self.children[p].add(c)
+        self.parents[c].add(p)
+        if self.program is not None:
+            self.pending.append((p, c))
+        return True
+
+    def parents_of(self, name):
+        pid = self.ids.get(name)
+        return [] if pid is None else [self.names[p] for p in self.parents[pid]]
+
+    def children_of(self, name):
+        pid = self.ids.get(name)
+        return [] if pid is None else [self.names[c] for c in self.children[pid]]
+
+    def is_parent(self, x, y):
+        px, py = self.ids.get(x), self.ids.get(y)
+        return px is not None and py is not None and py in self.children[px]
+
+    def siblings(self, x, y):
+        px, py = self.ids.get(x), self.ids.get(y)
+        if px is None or py is None or px == py:
+            return False
+        return not self.parents[px].isdisjoint(self.parents[py])
+
+    def grandparent(self, x, y):
+        px, py = self.ids.get(x), self.ids.get(y)
+        if px is None or py is None:
+            return False
+        return any(px in self.parents[p] for p in self.parents[py])
+
+    def derived(self, rules=FAMILY_RULES):
+        # The rule program, with `rules` added if new and every relation up
+        # to date with the parent facts
+        if self.program is None:
+            self.program = datalog.Program()
+            self.program.add_facts("parent", [(p, c) for p, kids in enumerate(self.children) for c in kids])
+        for rule in rules:
+            if rule not in self.rules:
+                self.program.add_rule(rule)
+                self.rules.add(rule)
+        if self.pending:
+            self.program.add_facts("parent", self.pending)
+            self.pending = []
+        if self.program.stale:
+            self.program.evaluate()
+        return self.program
+
+    def _related(self, pred, name, rules=FAMILY_RULES):
+        pid = self.ids.get(name)
+        if pid is None:
+            return []
+        return [self.names[other] for _, other in self.derived(rules).query(pred, pid, None)]
+
+    def ancestors_of(self, name):
+        return self._related("descendant", name)
+
+    def descendants_of(self, name):
+        return self._related("ancestor", name)
+
+    def is_ancestor(self, x, y):
+        px, py = self.ids.get(x), self.ids.get(y)
+        return px is not None and py is not None and self.derived().holds("ancestor", px, py)
+
+    def cousins_of(self, name, k=1):
+        return self._related(f"cousin_{k}", name, cousin_rules(k))
+
+    def load_csv(self, path):
+        # One "parent,child" pair per row, indexed as it is read; an
+        # optional "parent,child" header row is skipped. Names are
+        # lowercased to match the query parser.
+        added = 0
+        with open(path, newline="") as f:
+            for row in csv.reader(f):
+                if len(row) < 2 or row[0].strip().lower() == "parent":
+                    continue
+                added += self.add_parent(row[0].strip().lower(), row[1].strip().lower())
+        return added
+
+store = FactStore(facts["parent"])
+
 # Inference rules
 def is_parent(x, y):
-    return ("parent", (x, y)) in [("parent", f) for f in facts["parent"]]
+    return store.is_parent(x, y)
 
 def siblings(x, y):
-    for p1 in facts["parent"]:
-        for p2 in facts["parent"]:
-            if p1[0] == p2[0] and p1[1] == x and p2[1] == y and x != y:
-                return True
-    return False
+    return store.siblings(x, y)
 
 def grandparents(x, y):
-    for (p, c) in facts["parent"]:
-        if p == x:
-            for (p2, c2) in facts["parent"]:
-                if p2 == c and c2 == y:
-                    return True
-    return False
+    return store.grandparent(x, y)
 
 # Query parser
 def query_family_tree(query):
     tokens = query.lower().split()
-    
+    if not tokens:
+        return "Query not understood."
+
     if tokens[0] == "parents" and tokens[1] == "of":
-        child = tokens[2]
-        return [p for (p, c) in facts["parent"] if c == child]
-    
+        return store.parents_of(tokens[2])
+
     elif tokens[0] == "children" and tokens[1] == "of":
-        parent = tokens[2]
-        return [c for (p, c) in facts["parent"] if p == parent]
-    
+        return store.children_of(tokens[2])
+
     elif tokens[0] == "siblings":
-        x, y = tokens[2], tokens[4]
+        x, y = tokens[1], tokens[3]
         return siblings(x, y)
-    
+
     elif tokens[0] == "grandparent":
-        x, y = tokens[2], tokens[4]
+        x, y = tokens[1], tokens[3]
         return grandparents(x, y)
-    
+
+    elif tokens[0] == "ancestors" and tokens[1] == "of":
+        return store.ancestors_of(tokens[2])
+
+    elif tokens[0] == "descendants" and tokens[1] == "of":
+        return store.descendants_of(tokens[2])
+
+    elif tokens[0] == "ancestor":
+        x, y = tokens[1], tokens[3]
+        return store.is_ancestor(x, y)
+
+    elif tokens[0] == "cousins" and len(tokens) > 2 and tokens[1] == "of":
+        # "cousins of alice" or "cousins of alice degree 2"
+        k = 1
+        if len(tokens) > 3:
+            if len(tokens) != 5 or tokens[3] != "degree" or not tokens[4].isdigit():
+                return "Query not understood."
+            k = int(tokens[4])
+        return store.cousins_of(tokens[2], k)
+
+    elif tokens[0] == "load":
+        parts = query.split(None, 1)
+        if len(parts) < 2:
+            return "Usage: load <path to parent,child CSV>"
+        path = parts[1]
+        try:
+            return f"{store.load_csv(path)} new parent facts loaded"
+        except OSError as exc:
+            return f"Cannot load {path}: {exc.strerror}"
+
     else:
         return "Query not understood."
 
 # ----------------- Example -----------------
 if __name__ == "__main__":
     print("Family Tree Knowledge Base Parser")
-    print("Examples: 'parents of mary', 'children of john', 'siblings mary and mike', 'grandparent john of alice'")
+    print("Examples: 'parents of mary', 'children of john', 'siblings mary and mike', 'grandparent john of alice',")
+    print("          'ancestors of alice', 'descendants of john', 'ancestor john of bob', 'cousins of alice degree 1'")
 
     while True:
         q = input("\nEnter query (or 'exit'): ")
         if q.lower() == "exit":
             break
         print("Answer:", query_family_tree(q))
-explain the entire code step by step and alkso theorotically
 
 
@@ -0,0 +1,161 @@
+# bench_AI_3.py
+#
+# Family-tree queries on a generated genealogy: bulk CSV load into the
+# indexed fact store, per-query latency against the original scans over
+# the list of parent facts, and materialized recursive relations
+# (ancestor, cousins) against re-deriving them per query.
+# Usage: python bench_AI_3.py [parent_edges]
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import deque
+
+import AI_3
+import datalog
+
+
+def write_genealogy(path, edges, seed=0):
+    # Generations of couples; every child gets both parents from the
+    # generation before, so the tree is deep and siblings are common
+    rng = random.Random(seed)
+    written, generation, people = 0, [f"p0_{i}" for i in range(1000)], 1000
+    with open(path, "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["parent", "child"])
+        g = 0
+        while written < edges:
+            g += 1
+            children = []
+            for _ in range(len(generation)):
+                mother, father = rng.sample(generation, 2)
+                child = f"p{g}_{people}"
+                people += 1
+                out.writerow([mother, child])
+                out.writerow([father, child])
+                children.append(child)
+                written += 2
+                if written >= edges:
+                    break
+            generation = children
+
+
+def legacy_parents_of(facts, child):
+    return [p for (p, c) in facts if c == child]
+
+
+def legacy_is_parent(facts, x, y):
+    return ("parent", (x, y)) in [("parent", f) for f in facts]
+
+
+def time_queries(label, fn, queries):
+    start = time.perf_counter()
+    for q in queries:
+        fn(*q)
+    per_query = (time.perf_counter() - start) / len(queries)
+    print(f"{label:<36}{1e6 * per_query:>14,.1f}")
+
+
+def generation_tree(generations, width, seed=0):
+    # Each person past the first generation has two parents in the one before
+    rng = random.Random(seed)
+    pairs, previous = [], [f"g0_{i}" for i in range(width)]
+    for g in range(1, generations):
+        current = [f"g{g}_{i}" for i in range(width)]
+        for child in current:
+            for parent in rng.sample(previous, 2):
+                pairs.append((parent, child))
+        previous = current
+    return pairs
+
+
+def ancestors_by_search(store, name):
+    # What a hand-coded query does without materialization
+    start = store.ids[name]
+    seen, queue = set(), deque([start])
+    while queue:
+        for p in store.parents[queue.popleft()]:
+            if p not in seen:
+                seen.add(p)
+                queue.append(p)
+    return {store.names[p] for p in seen}
+
+
+def check_repeated_variables():
+    # A variable used twice in one literal must match equal columns
+    program = datalog.Program(["loop(X) :- edge(X, X).",
+                               "back(X, Y) :- edge(X, Y), edge(Y, X), X != Y."])
+    program.add_facts("edge", [(1, 1), (1, 2), (2, 1), (2, 3)])
+    assert sorted(program.query("loop", None)) == [(1,)]
+    assert sorted(program.query("back", None, None)) == [(1, 2), (2, 1)]
+
+
+def datalog_benchmark(generations=10, width=200, late=200):
+    pairs = generation_tree(generations, width)
+    early, extra = pairs[:-late], pairs[-late:]
+    store = AI_3.FactStore(early)
+    print(f"\nRecursive relations: {generations} generations of {width}, {len(early):,} parent facts")
+
+    start = time.perf_counter()
+    program = store.derived(AI_3.FAMILY_RULES + list(AI_3.cousin_rules(1)))
+    print(f"{'materialize (semi-naive)':<36}{time.perf_counter() - start:>13.2f}s"
+          f"   {len(program.relations['ancestor']):,} ancestor, {len(program.relations['cousin_1']):,} cousin pairs")
+
+    rng = random.Random(2)
+    people = rng.sample(store.names, 300)
+    for name in people:
+        assert set(store.ancestors_of(name)) == ancestors_by_search(store, name)
+    print(f"{'query':<36}{'us per query':>14}")
+    time_queries("ancestors of (search per query)", lambda n: ancestors_by_search(store, n), [(n,) for n in people])
+    time_queries("ancestors of (materialized)", store.ancestors_of, [(n,) for n in people])
+    time_queries("cousins of (materialized)", store.cousins_of, [(n,) for n in people])
+
+    start = time.perf_counter()
+    for parent, child in extra:
+        store.add_parent(parent, child)
+    store.derived()
+    incremental = time.perf_counter() - start
+    start = time.perf_counter()
+    fresh = datalog.Program(AI_3.FAMILY_RULES + list(AI_3.cousin_rules(1)))
+    fresh.add_facts("parent", [(store.ids[p], store.ids[c]) for p, c in pairs])
+    fresh.evaluate()
+    print(f"{f'add {late} facts (incremental)':<36}{incremental:>13.2f}s")
+    print(f"{f'add {late} facts (re-evaluate)':<36}{time.perf_counter() - start:>13.2f}s")
+    for pred in ("ancestor", "descendant", "cousin_1"):
+        assert store.program.relations[pred] == fresh.relations[pred]
+
+
+if __name__ == "__main__":
+    edges = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    path = os.path.join(tempfile.mkdtemp(), "genealogy.csv")
+    write_genealogy(path, edges)
+
+    store = AI_3.FactStore()
+    start = time.perf_counter()
+    added = store.load_csv(path)
+    print(f"Loaded {added:,} parent facts for {len(store.names):,} people "
+          f"in {time.perf_counter() - start:.2f}s\n")
+
+    rng = random.Random(1)
+    facts = [(store.names[p], store.names[c]) for c in range(len(store.names)) for p in store.parents[c]]
+    people = rng.sample(store.names, 200)
+    pairs = [(rng.choice(store.names), rng.choice(store.names)) for _ in range(200)]
+    pairs += [(store.parents_of(c)[0], c) for c in people if store.parents_of(c)]
+    grand = [(store.parents_of(store.parents_of(c)[0])[0], c) for c in people
+             if store.parents_of(c) and store.parents_of(store.parents_of(c)[0])]
+
+    print(f"{'query':<36}{'us per query':>14}")
+    time_queries("parents of (list scan)", lambda c: legacy_parents_of(facts, c), [(c,) for c in people[:5]])
+    time_queries("parents of (index)", store.parents_of, [(c,) for c in people])
+    time_queries("children of (index)", store.children_of, [(c,) for c in people])
+    time_queries("is parent (list rebuild)", lambda x, y: legacy_is_parent(facts, x, y), pairs[:3])
+    time_queries("is parent (index)", store.is_parent, pairs)
+    time_queries("siblings (index)", store.siblings, pairs)
+    time_queries("grandparent (index)", store.grandparent, grand)
+    os.remove(path)
+
+    check_repeated_variables()
+    datalog_benchmark()
@@ -0,0 +1,281 @@
+# datalog.py
+#
+# A small bottom-up Datalog engine. Rules are written as text, e.g.
+#
+#     ancestor(X, Y) :- parent(X, Z), ancestor(Z, Y).
+#
+# Variables start with an uppercase letter; body literals may be negated
+# ("not p(X, Y)") or be an inequality ("X != Y"), and are evaluated left to
+# right, so negations and inequalities must come after the literals that
+# bind their variables. Rules are stratified for negation and every
+# derived relation is materialized once by semi-naive iteration. New base
+# facts are then propagated as deltas; a stratum that negates a changed
+# relation is recomputed instead.
+
+import re
+from collections import defaultdict
+
+POS, NEG, NEQ = "pos", "neg", "neq"
+
+_LITERAL = re.compile(r"\s*(not\s+)?(\w+)\s*\(([^)]*)\)\s*|\s*(\w+)\s*!=\s*(\w+)\s*")
+
+# ------------------ Parsing ------------------
+
+def is_variable(term):
+    return isinstance(term, str) and term[:1].isupper()
+
+def _term(text):
+    text = text.strip()
+    return int(text) if text.lstrip("-").isdigit() else text
+
+def parse_literal(text):
+    match = _LITERAL.fullmatch(text)
+    if not match:
+        raise ValueError(f"Cannot parse literal {text!r}.")
+    negated, pred, args, left, right = match.groups()
+    if pred is None:
+        return (NEQ, None, (_term(left), _term(right)))
+    args = tuple(_term(a) for a in args.split(",")) if args.strip() else ()
+    return (NEG if negated else POS, pred, args)
+
+def parse_rule(text):
+    # "head :- lit, lit, ... ." -> (head pred, head args, body literals)
+    text = text.strip().rstrip(".")
+    head, _, body = text.partition(":-")
+    kind, pred, args = parse_literal(head)
+    if kind is not POS:
+        raise ValueError(f"Rule head must be a positive atom: {head!r}.")
+    literals = re.findall(r"(?:not\s+)?\w+\s*\([^)]*\)|\w+\s*!=\s*\w+", body)
+    return pred, args, [parse_literal(lit) for lit in literals]
+
+# ------------------ Compiled Rules ------------------
+
+class Rule:
+    # Variables are numbered into slots of a binding list. For each body
+    # literal the slots bound before it are known statically, so every
+    # literal gets a fixed index key (bound positions) and a fixed list
+    # of positions that bind new slots.
+    def __init__(self, head, head_args, body):
+        self.head = head
+        self.body = body
+        slots = {}
+        self.plans = []
+        for kind, pred, args in body:
+            bound, binds, repeats = [], [], []
+            earlier = set(slots)  # variables bound by previous literals
+            for pos, term in enumerate(args):
+                if not is_variable(term):
+                    bound.append((pos, False, term))
+                elif term in earlier:
+                    bound.append((pos, True, slots[term]))
+                elif kind is POS:
+                    if term in slots:
+                        # Second occurrence within this literal, e.g. edge(X, X)
+                        repeats.append((pos, args.index(term)))
+                    else:
+                        slots[term] = len(slots)
+                        binds.append((pos, slots[term]))
+                else:
+                    raise ValueError(f"Variable {term} must be bound before {kind} literal {pred or '!='}.")
+            self.plans.append((kind, pred, tuple(p for p, _, _ in bound), bound, binds, repeats))
+        for term in head_args:
+            if is_variable(term) and term not in slots:
+                raise ValueError(f"Head variable {term} of {head} does not occur in the body.")
+        self.head_terms = [(True, slots[t]) if is_variable(t) else (False, t) for t in head_args]
+        self.size = len(slots)
+
+# ------------------ Program ------------------
+
+class Program:
+    def __init__(self, rules=()):
+        self.rules = []
+        self.relations = defaultdict(set)
+        # (pred, bound positions) -> {key tuple: [tuples]}, kept up to date
+        self.indexes = defaultdict(dict)
+        self.strata = []
+        # Derived relations whose rules changed since they were evaluated
+        self.stale = set()
+        for rule in rules:
+            self.add_rule(rule)
+
+    def add_rule(self, text):
+        head, args, body = parse_rule(text)
+        self.rules.append(Rule(head, args, body))
+        self.stale.add(head)
+
+    # ---------- storage ----------
+
+    def _insert(self, pred, tuples):
+        self.relations[pred] |= tuples
+        for positions, index in self.indexes[pred].items():
+            for t in tuples:
+                index.setdefault(tuple(t[p] for p in positions), []).append(t)
+
+    def _index(self, pred, positions):
+        indexes = self.indexes[pred]
+        index = indexes.get(positions)
+        if index is None:
+            index = indexes[positions] = {}
+            for t in self.relations[pred]:
+                index.setdefault(tuple(t[p] for p in positions), []).append(t)
+        return index
+
+    def _clear(self, pred):
+        self.relations[pred] = set()
+        self.indexes[pred] = {}
+
+    # ---------- evaluation ----------
+
+    def _stratify(self):
+        derived = {rule.head for rule in self.rules}
+        stratum = defaultdict(int)
+        changed = True
+        while changed:
+            changed = False
+            for rule in self.rules:
+                for kind, pred, _ in rule.body:
+                    if kind is NEQ:
+                        continue
+                    need = stratum[pred] + (kind is NEG)
+                    if need > stratum[rule.head]:
+                        if need > len(derived):
+                            raise ValueError(f"Rules are not stratifiable: {rule.head} depends negatively on itself.")
+                        stratum[rule.head] = need
+                        changed = True
+        levels = defaultdict(set)
+        for pred in derived:
+            levels[stratum[pred]].add(pred)
+        self.strata = [levels[s] for s in sorted(levels)]
+
+    def _fire(self, rule, delta_at, delta):
+        # Every head tuple derivable with body literal delta_at ranging
+        # over delta and every other literal over the full relations
+        plans, results = rule.plans, []
+        binding = [None] * rule.size
+        delta_index = {}
+        if delta_at >= 0:
+            positions = plans[delta_at][2]
+            for t in delta:
+                delta_index.setdefault(tuple(t[p] for p in positions), []).append(t)
+
+        def walk(i):
+            if i == len(plans):
+                results.append(tuple(binding[v] if is_var else v for is_var, v in rule.head_terms))
+                return
+            kind, pred, positions, bound, binds, repeats = plans[i]
+            key = tuple(binding[v] if is_var else v for _, is_var, v in bound)
+            if kind is NEQ:
+                if key[0] != key[1]:
+                    walk(i + 1)
+                return
+            if kind is NEG:
+                if key not in self.relations[pred]:
+                    walk(i + 1)
+                return
+            if i == delta_at:
+                candidates = delta_index.get(key, ())
+            elif positions:
+                candidates = self._index(pred, positions).get(key, ())
+            else:
+                candidates = self.relations[pred]
+            for t in candidates:
+                if repeats and any(t[p] != t[q] for p, q in repeats):
+                    continue
+                for p, slot in binds:
+                    binding[slot] = t[p]
+                walk(i + 1)
+
+        walk(0)
+        return results
+
+    def _run_stratum(self, preds, deltas, full):
+        # Semi-naive fixpoint of the rules for preds. With full=True the
+        # first round is a plain evaluation over the current relations;
+        # otherwise it only joins against the given deltas. Every new tuple
+        # is added to deltas so later strata see it.
+        rules = [rule for rule in self.rules if rule.head in preds]
+        current = deltas
+        first = True
+        while True:
+            new = defaultdict(set)
+            for rule in rules:
+                if first and full:
+                    derived = self._fire(rule, -1, None)
+                else:
+                    derived = []
+                    for i, (kind, pred, _) in enumerate(rule.body):
+                        if kind is POS and current.get(pred):
+                            derived += self._fire(rule, i, current[pred])
+                relation = self.relations[rule.head]
+                for t in derived:
+                    if t not in relation:
+                        new[rule.head].add(t)
+            first = False
+            if not new:
+                return
+            for pred, tuples in new.items():
+                self._insert(pred, tuples)
+                deltas.setdefault(pred, set()).update(tuples)
+            current = new
+
+    def evaluate(self):
+        # Materialize, from scratch, every relation with new rules and every
+        # relation that depends on one; the rest are already up to date
+        self._stratify()
+        redo = set(self.stale)
+        changed = True
+        while changed:
+            changed = False
+            for rule in self.rules:
+                if rule.head not in redo and any(p in redo for _, p, _ in rule.body):
+                    redo.add(rule.head)
+                    changed = True
+        for preds in self.strata:
+            preds = preds & redo
+            if preds:
+                for pred in preds:
+                    self._clear(pred)
+                self._run_stratum(preds, {}, full=True)
+        self.stale.clear()
+
+    def add_facts(self, pred, tuples):
+        # Insert base facts and bring every derived relation up to date.
+        # Returns the number of facts that were new.
+        if self.stale:
+            self.evaluate()
+        new = set(map(tuple, tuples)) - self.relations[pred]
+        if not new:
+            return 0
+        self._insert(pred, new)
+        deltas = {pred: new}
+        rebuilt = set()  # relations that may have lost tuples
+        for preds in self.strata:
+            rules = [rule for rule in self.rules if rule.head in preds]
+            used = {p for rule in rules for kind, p, _ in rule.body if kind is not NEQ}
+            negated = {p for rule in rules for kind, p, _ in rule.body if kind is NEG}
+            if negated & deltas.keys() or used & rebuilt:
+                for p in preds:
+                    self._clear(p)
+                self._run_stratum(preds, deltas, full=True)
+                rebuilt |= preds
+            else:
+                self._run_stratum(preds, deltas, full=False)
+        return len(new)
+
+    # ---------- queries ----------
+
+    def query(self, pred, *args):
+        # Tuples of pred matching args, where None matches anything
+        if self.stale:
+            self.evaluate()
+        positions = tuple(i for i, a in enumerate(args) if a is not None)
+        if len(positions) == len(args):
+            return [args] if tuple(args) in self.relations[pred] else []
+        if not positions:
+            return list(self.relations[pred])
+        return self._index(pred, positions).get(tuple(args[i] for i in positions), [])
+
+    def holds(self, pred, *args):
+        if self.stale:
+            self.evaluate()
+        return tuple(args) in self.relations[pred]
@@ -1,29 +1,47 @@
 # a_star_menu.py
 
 import heapq
+import itertools
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import npuzzle
 
 # ----------------- A* Algorithm -----------------
-def a_star_search(start, goal, neighbors_fn, heuristic_fn):
-    open_list = []
-    heapq.heappush(open_list, (0 + heuristic_fn(start, goal), 0, start, [start]))
-    closed_set = set()
+def a_star_search(start, goal, neighbors_fn, heuristic_fn, key_fn=None):
+    # key_fn maps a state to a hashable key (identity by default), so
+    # unhashable states such as list-of-lists boards can be searched
+    key = key_fn or (lambda state: state)
+    goal_key = key(goal)
+    start_key = key(start)
+    best_g = {start_key: 0}
+    parent = {start_key: None}
+    states = {start_key: start}
+    counter = itertools.count()  # tie-breaker, heap never compares states
+    open_list = [(heuristic_fn(start, goal), 0, next(counter), start_key)]
 
     while open_list:
-        f, g, node, path = heapq.heappop(open_list)
-
-        if node == goal:
-            return path, g
-
-        if node in closed_set:
-            continue
-        closed_set.add(node)
-
-        for (neighbor, cost) in neighbors_fn(node):
-            if neighbor in closed_set:
-                continue
+        f, g, _, node_key = heapq.heappop(open_list)
+        if g > best_g[node_key]:
+            continue  # stale entry, a cheaper path was pushed later
+
+        if node_key == goal_key:
+            path = []
+            while node_key is not None:
+                path.append(states[node_key])
+                node_key = parent[node_key]
+            return path[::-1], g
+
+        for (neighbor, cost) in neighbors_fn(states[node_key]):
+            neighbor_key = key(neighbor)
             g_new = g + cost
-            f_new = g_new + heuristic_fn(neighbor, goal)
-            heapq.heappush(open_list, (f_new, g_new, neighbor, path + [neighbor]))
+            if g_new >= best_g.get(neighbor_key, float("inf")):
+                continue  # not an improvement, skip the push
+            best_g[neighbor_key] = g_new
+            parent[neighbor_key] = node_key
+            states[neighbor_key] = neighbor
+            heapq.heappush(open_list, (g_new + heuristic_fn(neighbor, goal), g_new, next(counter), neighbor_key))
     return None, float("inf")
 
 # ----------------- Application 1: Shortest Path in Graph -----------------
@@ -56,7 +74,7 @@ goal_state = [[1,2,3],[4,5,6],[7,8,0]]  # 0 represents blank
 
 def neighbors_puzzle(state):
     neighbors = []
-    n = 3
+    n = len(state)
     # locate blank
     for i in range(n):
         for j in range(n):
@@ -72,39 +90,84 @@ def neighbors_puzzle(state):
             neighbors.append((new_state, 1))  # cost = 1 per move
     return neighbors
 
+def puzzle_key(state):
+    return tuple(map(tuple, state))
+
 def heuristic_puzzle(state, goal):
     # Manhattan distance
     dist = 0
-    for i in range(3):
-        for j in range(3):
+    n = len(state)
+    goal_pos = {goal[r][c]: (r, c) for r in range(n) for c in range(n)}
+    for i in range(n):
+        for j in range(n):
             val = state[i][j]
             if val != 0:
-                gi, gj = [(r,c) for r in range(3) for c in range(3) if goal[r][c]==val][0]
+                gi, gj = goal_pos[val]
                 dist += abs(i-gi) + abs(j-gj)
     return dist
 
 def puzzle_demo():
     print("\n--- A* Search on 8-Puzzle ---")
     start_state = [[1,2,3],[4,0,6],[7,5,8]]
-    path, cost = a_star_search(start_state, goal_state, neighbors_puzzle, heuristic_puzzle)
+    path, cost = a_star_search(start_state, goal_state, neighbors_puzzle, heuristic_puzzle, puzzle_key)
     print(f"Solution found in {cost} moves")
     print("Final State:")
     for row in goal_state:
         print(row)
 
+# ----------------- Application 3: N x N Puzzle with IDA* -----------------
+def npuzzle_demo():
+    print("\n--- IDA* Search on N x N Puzzle ---")
+    n = int(input("Board size N (3 = 8-puzzle, 4 = 15-puzzle): "))
+    start_state = npuzzle.input_board(n)
+    stats = {}
+    path = npuzzle.ida_star(start_state, stats)
+    if path is None:
+        print("This board is unsolvable.")
+        return
+    print(f"Solution found in {len(path) - 1} moves ({stats['expanded']} nodes expanded)")
+    for row in path[-1]:
+        print(row)
+
+# ----------------- Application 4: Road Graph with ALT Heuristic -----------------
+def road_graph_demo():
+    import road_graph
+    print("\n--- A* with Landmarks on an Edge-List Graph ---")
+    path = input("Edge-list file (u v [weight] per line): ")
+    directed = input("Directed graph? (y/n): ").lower().startswith("y")
+    graph = road_graph.load_edge_list(path, directed)
+    landmarks = road_graph.build_landmarks(graph, int(input("Number of landmarks: ")), directed)
+    heuristic = road_graph.alt_heuristic(landmarks)
+    print(f"Loaded {len(graph)} nodes, {len(graph.targets)} edges")
+    print("Enter queries as 'start goal', blank line to finish:")
+    pairs = []
+    while True:
+        line = input().split()
+        if not line:
+            break
+        pairs.append((line[0], line[1]))
+    for (start, goal), (route, cost) in zip(pairs, road_graph.batch_query(graph, pairs, heuristic)):
+        print(f"Path from {start} to {goal}: {route}, Cost = {cost}")
+
 # ----------------- Menu -----------------
 def main():
     while True:
         print("\n--- A* Algorithm Applications ---")
         print("1. Shortest Path in Graph")
         print("2. Solve 8-Puzzle Problem")
-        print("3. Exit")
+        print("3. Solve N x N Puzzle with IDA*")
+        print("4. Shortest Paths on a Road Graph (ALT)")
+        print("5. Exit")
         choice = input("Enter choice: ")
         if choice == "1":
             graph_demo()
         elif choice == "2":
             puzzle_demo()
         elif choice == "3":
+            npuzzle_demo()
+        elif choice == "4":
+            road_graph_demo()
+        elif choice == "5":
             print("Exiting...")
             break
         else:
@@ -112,6 +175,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-explain entire code step by step and also therotically
-
-
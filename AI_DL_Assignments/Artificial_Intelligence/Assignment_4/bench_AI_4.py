@@ -0,0 +1,57 @@
+# bench_AI_4.py
+#
+# A* on sliding puzzles: Manhattan distance vs additive pattern databases.
+# Usage: python bench_AI_4.py [board_size] [num_boards] [scramble_moves]
+
+import random
+import sys
+import time
+
+import AI_4
+import npuzzle
+import pattern_db
+
+
+def random_board(n, scramble, rng):
+    tiles = npuzzle.flatten(npuzzle.goal_board(n))
+    blank = n * n - 1
+    table = npuzzle.move_table(n)
+    for _ in range(scramble):
+        cell = rng.choice(table[blank])
+        tiles[blank], tiles[cell] = tiles[cell], 0
+        blank = cell
+    return [tiles[i * n:(i + 1) * n] for i in range(n)]
+
+
+def run(label, boards, goal, heuristic_fn):
+    expanded = 0
+
+    def counting_neighbors(state):
+        nonlocal expanded
+        expanded += 1
+        return AI_4.neighbors_puzzle(state)
+
+    start = time.perf_counter()
+    costs = [AI_4.a_star_search(b, goal, counting_neighbors, heuristic_fn, AI_4.puzzle_key)[1] for b in boards]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<16}{expanded:>12}{expanded / len(boards):>14.0f}{1000 * elapsed / len(boards):>14.2f}")
+    return costs
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    scramble = int(sys.argv[3]) if len(sys.argv) > 3 else (300 if n == 3 else 60)
+    rng = random.Random(0)
+    boards = [random_board(n, scramble, rng) for _ in range(count)]
+    goal = npuzzle.goal_board(n)
+
+    start = time.perf_counter()
+    pdb = pattern_db.make_heuristic(pattern_db.load_pattern_dbs(n))
+    print(f"PDBs loaded in {time.perf_counter() - start:.2f}s (built on first run)\n")
+
+    print(f"{count} boards, {n}x{n}, {scramble}-move random walks\n")
+    print(f"{'heuristic':<16}{'expanded':>12}{'per solve':>14}{'ms/solve':>14}")
+    manhattan = run("manhattan", boards, goal, AI_4.heuristic_puzzle)
+    additive = run("additive pdb", boards, goal, pdb)
+    assert manhattan == additive, "both heuristics are admissible, costs must match"
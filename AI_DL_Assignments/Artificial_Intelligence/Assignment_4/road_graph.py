@@ -0,0 +1,128 @@
+# road_graph.py
+#
+# Large-graph backend for a_star_search: compact CSR adjacency arrays
+# loaded from an edge-list file, plus ALT (A*, Landmarks, Triangle
+# inequality) heuristics with landmark distances precomputed by Dijkstra.
+
+import heapq
+from array import array
+
+from AI_4 import a_star_search
+
+INF = float("inf")
+
+# ----------------- CSR Graph -----------------
+class CSRGraph:
+    # Edges of node u are targets[offsets[u]:offsets[u+1]] with matching weights
+    def __init__(self, names, sources, targets, weights):
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)}
+        n = len(names)
+        self.offsets = array("q", [0]) * (n + 1)
+        for u in sources:
+            self.offsets[u + 1] += 1
+        for u in range(n):
+            self.offsets[u + 1] += self.offsets[u]
+
+        cursor = array("q", self.offsets[:-1])
+        self.targets = array("l", [0]) * len(targets)
+        self.weights = array("d", [0.0]) * len(targets)
+        for u, v, w in zip(sources, targets, weights):
+            i = cursor[u]
+            self.targets[i] = v
+            self.weights[i] = w
+            cursor[u] = i + 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def neighbors(self, u):
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def reverse(self):
+        sources = array("l")
+        for u in range(len(self)):
+            sources.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+        return CSRGraph(self.names, self.targets, sources, self.weights)
+
+
+def load_edge_list(path, directed=False):
+    # One edge per line: "u v [weight]"; blank lines and '#' comments skipped
+    ids, names = {}, []
+    sources, targets, weights = array("l"), array("l"), array("d")
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0].startswith("#"):
+                continue
+            for name in parts[:2]:
+                if name not in ids:
+                    ids[name] = len(names)
+                    names.append(name)
+            u, v = ids[parts[0]], ids[parts[1]]
+            w = float(parts[2]) if len(parts) > 2 else 1.0
+            sources.append(u); targets.append(v); weights.append(w)
+            if not directed:
+                sources.append(v); targets.append(u); weights.append(w)
+    return CSRGraph(names, sources, targets, weights)
+
+# ----------------- Dijkstra -----------------
+def dijkstra(graph, source):
+    dist = array("d", [INF]) * len(graph)
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, w in graph.neighbors(u):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+# ----------------- ALT Heuristic -----------------
+def build_landmarks(graph, count=8, directed=False, seed_node=0):
+    # Farthest-point selection: each new landmark is the node farthest from
+    # all landmarks chosen so far. Returns (from_landmark, to_landmark)
+    # lists of distance arrays, d(L, v) and d(v, L).
+    reverse = graph.reverse() if directed else None
+    from_landmark, to_landmark = [], []
+    nearest = array("d", [INF]) * len(graph)
+    candidate = dijkstra(graph, seed_node)
+    landmark = max(range(len(graph)), key=lambda v: candidate[v] if candidate[v] < INF else -1)
+    for _ in range(min(count, len(graph))):
+        dist = dijkstra(graph, landmark)
+        from_landmark.append(dist)
+        to_landmark.append(dijkstra(reverse, landmark) if directed else dist)
+        for v in range(len(graph)):
+            if dist[v] < nearest[v]:
+                nearest[v] = dist[v]
+        landmark = max(range(len(graph)), key=lambda v: nearest[v] if nearest[v] < INF else -1)
+    return from_landmark, to_landmark
+
+def alt_heuristic(landmarks):
+    pairs = list(zip(*landmarks))
+
+    def heuristic(node, goal):
+        # Triangle inequality in both directions; NaN (both unreachable)
+        # never compares greater, so it is ignored
+        h = 0.0
+        for d_from, d_to in pairs:
+            a = d_from[goal] - d_from[node]
+            b = d_to[node] - d_to[goal]
+            if a > h: h = a
+            if b > h: h = b
+        return h
+    return heuristic
+
+# ----------------- Batch Queries -----------------
+def batch_query(graph, pairs, heuristic_fn=None):
+    # Answer many (start, goal) name pairs against one loaded graph,
+    # yielding (path of names, cost) in input order
+    heuristic_fn = heuristic_fn or (lambda node, goal: 0.0)
+    for start, goal in pairs:
+        path, cost = a_star_search(graph.ids[start], graph.ids[goal], graph.neighbors, heuristic_fn)
+        yield ([graph.names[u] for u in path] if path else None), cost
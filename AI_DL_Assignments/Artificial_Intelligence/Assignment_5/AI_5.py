@@ -1,4 +1,196 @@
 import math
+import mmap
+import os
+
+import mnk_game
+
+# ------------------- Bitboards -------------------
+# The engine keeps one 9-bit int per player; cell (i, j) is bit 3*i + j.
+
+FULL = 0b111111111
+
+WIN_MASKS = [
+    0b000000111, 0b000111000, 0b111000000,   # rows
+    0b001001001, 0b010010010, 0b100100100,   # columns
+    0b100010001, 0b001010100,                # diagonals
+]
+
+def to_bitboards(board):
+    x = o = 0
+    for i in range(3):
+        for j in range(3):
+            if board[i][j] == "X":
+                x |= 1 << (3 * i + j)
+            elif board[i][j] == "O":
+                o |= 1 << (3 * i + j)
+    return x, o
+
+def from_bitboards(x, o):
+    return [["X" if x >> (3 * i + j) & 1 else "O" if o >> (3 * i + j) & 1 else "_"
+             for j in range(3)] for i in range(3)]
+
+# WON[player]: does this set of cells contain a line? (all 512 subsets)
+WON = [any(player & mask == mask for mask in WIN_MASKS) for player in range(FULL + 1)]
+
+def evaluate_bits(x, o):
+    if WON[o]:
+        return 10
+    if WON[x]:
+        return -10
+    return 0
+
+def popcount(mask):
+    return bin(mask).count("1")
+
+# Empty-cell mask -> its set bits, lowest first
+MOVES = [[1 << b for b in range(9) if mask >> b & 1] for mask in range(FULL + 1)]
+
+# Symmetries of the square as cell permutations (cell = 3*row + col):
+# rotations by 0/90/180/270 degrees, each with and without a mirror
+def _rotate(cells):
+    return [cells[6 - 3 * (i % 3) + i // 3] for i in range(9)]
+
+SYMMETRIES = []
+_cells = list(range(9))
+for _ in range(4):
+    SYMMETRIES.append(_cells)
+    SYMMETRIES.append([_cells[3 * (i // 3) + 2 - i % 3] for i in range(9)])
+    _cells = _rotate(_cells)
+
+# IMAGES[s][mask]: mask with its cells moved by symmetry s
+IMAGES = [[sum(1 << k for k, src in enumerate(perm) if mask >> src & 1) for mask in range(FULL + 1)]
+          for perm in SYMMETRIES]
+
+# ------------------- Search -------------------
+
+# Canonical position -> (value, flag), shared by every search
+EXACT, LOWER, UPPER = 0, 1, 2
+transposition_table = {}
+
+def board_key(x, o, is_max):
+    # Smallest (x, o) image over the 8 symmetries, plus side to move, so
+    # mirror images and rotations share one table entry
+    best = min((image[x] << 9) | image[o] for image in IMAGES)
+    return best * 2 + is_max
+
+def alphabeta(x, o, is_max, alpha, beta, stats=None):
+    # Scores are +/-(20 - pieces on the board at the end), so faster wins
+    # score higher and a value never depends on where the search started
+    if stats is not None:
+        stats["nodes"] = stats.get("nodes", 0) + 1
+    if WON[o]:
+        return 20 - popcount(x | o)
+    if WON[x]:
+        return popcount(x | o) - 20
+    empty = FULL & ~(x | o)
+    if not empty:
+        return 0
+
+    key = board_key(x, o, is_max)
+    entry = transposition_table.get(key)
+    if entry is not None:
+        value, flag = entry
+        if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+            return value
+
+    alpha_orig, beta_orig = alpha, beta
+    best = -math.inf if is_max else math.inf
+    for move in MOVES[empty]:
+        if is_max:
+            best = max(best, alphabeta(x, o | move, False, alpha, beta, stats))
+            alpha = max(alpha, best)
+        else:
+            best = min(best, alphabeta(x | move, o, True, alpha, beta, stats))
+            beta = min(beta, best)
+        if alpha >= beta:
+            break
+
+    if best <= alpha_orig:
+        flag = UPPER
+    elif best >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    transposition_table[key] = (best, flag)
+    return best
+
+def best_move_bits(x, o, stats=None):
+    # The first move (lowest cell) with the best value for O, as in a plain
+    # minimax. Later moves are searched with alpha at the best value so
+    # far: they only need to be known exactly if they beat it.
+    best_val, best = -math.inf, None
+    for move in MOVES[FULL & ~(x | o)]:
+        value = alphabeta(x, o | move, False, best_val, math.inf, stats)
+        if value > best_val:
+            best, best_val = move, value
+    return best
+
+# ------------------- Perfect-Play Table -------------------
+# Two bytes per base-3 board code (cell i adds 3**i for X, 2 * 3**i for O):
+# the best cell for the side to move, first in row-major order as in
+# find_best_move (NO_MOVE once the game is over, NOT_REACHABLE if play
+# from the empty board with X first never gets there), and the exact
+# alpha-beta value as a signed byte.
+
+PLAY_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "AI_5_table.bin")
+NO_MOVE, NOT_REACHABLE = 9, 255
+
+# BASE3[mask]: sum of 3**i over the cells in mask
+BASE3 = [sum(3 ** b for b in range(9) if mask >> b & 1) for mask in range(FULL + 1)]
+
+def position_index(x, o):
+    return BASE3[x] + 2 * BASE3[o]
+
+def build_play_table(path=PLAY_TABLE_PATH):
+    # Solve all 5,478 positions reachable with X moving first
+    table = bytearray([NOT_REACHABLE, 0]) * 3 ** 9
+    stack = [(0, 0)]
+    while stack:
+        x, o = stack.pop()
+        index = 2 * position_index(x, o)
+        if table[index] != NOT_REACHABLE:
+            continue
+        is_max = popcount(o) < popcount(x)  # O moves after X
+        value = alphabeta(x, o, is_max, -math.inf, math.inf)
+        table[index], table[index + 1] = NO_MOVE, value & 0xFF
+        if WON[x] or WON[o]:
+            continue
+        for move in MOVES[FULL & ~(x | o)]:
+            child = (x, o | move) if is_max else (x | move, o)
+            stack.append(child)
+            if alphabeta(*child, not is_max, -math.inf, math.inf) == value and table[index] == NO_MOVE:
+                table[index] = move.bit_length() - 1
+    # Written under a temporary name so readers never map a partial file
+    with open(path + ".tmp", "wb") as f:
+        f.write(table)
+    os.replace(path + ".tmp", path)
+
+def load_play_table(path=PLAY_TABLE_PATH):
+    if not os.path.exists(path):
+        build_play_table(path)
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def lookup_position(table, x, o):
+    # (best cell or NO_MOVE / NOT_REACHABLE, value for O)
+    index = 2 * position_index(x, o)
+    value = table[index + 1]
+    return table[index], value - 256 if value > 127 else value
+
+_play_table = None
+
+def play_table():
+    # Loaded (and built, the first time ever) on first use; None if the
+    # file cannot be written or read, in which case moves are searched
+    global _play_table
+    if _play_table is None:
+        try:
+            _play_table = load_play_table()
+        except OSError:
+            _play_table = False
+    return _play_table or None
+
+# ------------------- Board Interface -------------------
 
 # Function to print the board
 def print_board(board):
@@ -8,112 +200,94 @@ def print_board(board):
 
 # Check for winner
 def evaluate(board):
-    # Rows
-    for row in board:
-        if row.count(row[0]) == 3 and row[0] != "_":
-            return 10 if row[0] == "O" else -10
-
-    # Columns
-    for col in range(3):
-        if board[0][col] == board[1][col] == board[2][col] != "_":
-            return 10 if board[0][col] == "O" else -10
-
-    # Diagonals
-    if board[0][0] == board[1][1] == board[2][2] != "_":
-        return 10 if board[0][0] == "O" else -10
-    if board[0][2] == board[1][1] == board[2][0] != "_":
-        return 10 if board[0][2] == "O" else -10
-
-    return 0
+    return evaluate_bits(*to_bitboards(board))
 
 # Check if moves are left
 def moves_left(board):
-    for row in board:
-        if "_" in row:
-            return True
-    return False
+    x, o = to_bitboards(board)
+    return x | o != FULL
 
 # Minimax Algorithm
 def minimax(board, depth, is_max):
-    score = evaluate(board)
-
-    # Terminal states
-    if score == 10:
-        return score - depth
-    if score == -10:
-        return score + depth
-    if not moves_left(board):
-        return 0
-
-    if is_max:  # Maximizer (AI)
-        best = -math.inf
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == "_":
-                    board[i][j] = "O"
-                    best = max(best, minimax(board, depth + 1, False))
-                    board[i][j] = "_"
-        return best
-    else:  # Minimizer (Human)
-        best = math.inf
-        for i in range(3):
-            for j in range(3):
-                if board[i][j] == "_":
-                    board[i][j] = "X"
-                    best = min(best, minimax(board, depth + 1, True))
-                    board[i][j] = "_"
-        return best
+    # Same values as a full minimax from this depth: wins count 10 minus
+    # the depth at which the game ends
+    x, o = to_bitboards(board)
+    value = alphabeta(x, o, is_max, -math.inf, math.inf)
+    shift = 10 + depth - popcount(x | o)
+    return value - shift if value > 0 else value + shift if value < 0 else 0
 
 # AI Move
-def find_best_move(board):
-    best_val = -math.inf
-    best_move = (-1, -1)
-
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == "_":
-                board[i][j] = "O"
-                move_val = minimax(board, 0, False)
-                board[i][j] = "_"
-
-                if move_val > best_val:
-                    best_move = (i, j)
-                    best_val = move_val
-    return best_move
+def find_best_move(board, stats=None):
+    # O(1) from the perfect-play table for any position reached with X
+    # moving first; anything else is searched
+    x, o = to_bitboards(board)
+    table = play_table()
+    if table is not None and popcount(x) == popcount(o) + 1:
+        cell, _ = lookup_position(table, x, o)
+        if cell < NO_MOVE:
+            return divmod(cell, 3)
+    move = best_move_bits(x, o, stats)
+    if move is None:
+        return (-1, -1)
+    return divmod(move.bit_length() - 1, 3)
 
 # ------------------- Game -------------------
+def read_game_settings():
+    # Board rows, columns and k in a row, plus the AI's seconds per move
+    # (only used off the 3x3 board, where the search is not exhaustive)
+    text = input("Board rows cols k (Enter for 3 3 3): ").split()
+    m, n, k = map(int, text) if text else (3, 3, 3)
+    if min(m, n, k) < 1:
+        raise ValueError("Rows, columns and k must be positive.")
+    time_limit = 0.0
+    if (m, n, k) != (3, 3, 3):
+        text = input("AI seconds per move (Enter for 1): ").strip()
+        time_limit = float(text) if text else 1.0
+        if not time_limit > 0:
+            raise ValueError("The AI needs a positive number of seconds per move.")
+    return m, n, k, time_limit
+
 def play_game():
-    board = [["_"] * 3 for _ in range(3)]
-    print("Tic Tac Toe - You are X, AI is O")
+    m, n, k, time_limit = read_game_settings()
+    board = [["_"] * n for _ in range(m)]
+    game = mnk_game.MNKBoard(m, n, k)
+    table = {}
+    print(f"{k} in a row on {m}x{n} - You are X, AI is O")
 
     while True:
         print_board(board)
 
         # Human move
         x, y = map(int, input("Enter your move (row col): ").split())
-        if board[x][y] != "_":
+        if not (0 <= x < m and 0 <= y < n) or board[x][y] != "_":
             print("Invalid move, try again.")
             continue
         board[x][y] = "X"
+        game.place(x * n + y, mnk_game.X)
 
-        if evaluate(board) == -10:
+        if game.winner:
             print_board(board)
             print("You win!")
             break
-        if not moves_left(board):
+        if game.full():
             print_board(board)
             print("It's a draw!")
             break
 
-        # AI move
-        ai_move = find_best_move(board)
+        # AI move: perfect play on 3x3, a timed search otherwise
+        if (m, n, k) == (3, 3, 3):
+            ai_move = find_best_move(board)
+        else:
+            cell = mnk_game.search_best_move(game, mnk_game.O, time_limit, table=table)
+            ai_move = divmod(cell, n)
         board[ai_move[0]][ai_move[1]] = "O"
+        game.place(ai_move[0] * n + ai_move[1], mnk_game.O)
 
-        if evaluate(board) == 10:
+        if game.winner:
             print_board(board)
             print("AI wins!")
             break
-        if not moves_left(board):
+        if game.full():
             print_board(board)
             print("It's a draw!")
             break
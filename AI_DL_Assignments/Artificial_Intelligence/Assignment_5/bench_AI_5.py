@@ -0,0 +1,191 @@
+# bench_AI_5.py
+#
+# Tic-Tac-Toe AI response time: the original full-tree minimax against
+# alpha-beta with a symmetry-canonical transposition table and against
+# the perfect-play table, a check that all three choose the same move in
+# every reachable position, positions
+# evaluated per second on list boards vs bitboards, and the depth the
+# m,n,k engine reaches on Gomoku within a time budget.
+# Usage: python bench_AI_5.py
+
+import math
+import time
+
+import AI_5
+import mnk_game
+
+
+def legacy_evaluate(board):
+    for row in board:
+        if row.count(row[0]) == 3 and row[0] != "_":
+            return 10 if row[0] == "O" else -10
+    for col in range(3):
+        if board[0][col] == board[1][col] == board[2][col] != "_":
+            return 10 if board[0][col] == "O" else -10
+    if board[0][0] == board[1][1] == board[2][2] != "_":
+        return 10 if board[0][0] == "O" else -10
+    if board[0][2] == board[1][1] == board[2][0] != "_":
+        return 10 if board[0][2] == "O" else -10
+    return 0
+
+
+def legacy_minimax(board, depth, is_max, counter):
+    counter[0] += 1
+    score = legacy_evaluate(board)
+    if score == 10:
+        return score - depth
+    if score == -10:
+        return score + depth
+    if not any("_" in row for row in board):
+        return 0
+    best = -math.inf if is_max else math.inf
+    for i in range(3):
+        for j in range(3):
+            if board[i][j] == "_":
+                board[i][j] = "O" if is_max else "X"
+                value = legacy_minimax(board, depth + 1, not is_max, counter)
+                board[i][j] = "_"
+                best = max(best, value) if is_max else min(best, value)
+    return best
+
+
+def legacy_best_move(board, counter):
+    best_val, best_move = -math.inf, (-1, -1)
+    for i in range(3):
+        for j in range(3):
+            if board[i][j] == "_":
+                board[i][j] = "O"
+                value = legacy_minimax(board, 0, False, counter)
+                board[i][j] = "_"
+                if value > best_val:
+                    best_move, best_val = (i, j), value
+    return best_move
+
+
+def reachable_positions():
+    # Every non-terminal position with O to move, X having moved first
+    seen, frontier, found = set(), [[["_"] * 3 for _ in range(3)]], []
+    while frontier:
+        board = frontier.pop()
+        key = tuple(c for row in board for c in row)
+        if key in seen:
+            continue
+        seen.add(key)
+        if legacy_evaluate(board) or "_" not in key:
+            continue
+        x_turn = key.count("X") == key.count("O")
+        if not x_turn:
+            found.append(board)
+        for i in range(3):
+            for j in range(3):
+                if board[i][j] == "_":
+                    child = [row[:] for row in board]
+                    child[i][j] = "X" if x_turn else "O"
+                    frontier.append(child)
+    return found
+
+
+def time_empty_board():
+    board = [["_"] * 3 for _ in range(3)]
+    print(f"{'empty board':<28}{'nodes':>10}{'ms':>10}")
+
+    counter = [0]
+    start = time.perf_counter()
+    legacy = legacy_best_move(board, counter)
+    print(f"{'full minimax':<28}{counter[0]:>10}{1000 * (time.perf_counter() - start):>10.1f}")
+
+    AI_5.transposition_table.clear()
+    for label in ("alpha-beta + table (cold)", "alpha-beta + table (warm)"):
+        stats = {}
+        start = time.perf_counter()
+        move = AI_5.best_move_bits(0, 0, stats)
+        print(f"{label:<28}{stats['nodes']:>10}{1000 * (time.perf_counter() - start):>10.1f}")
+        assert divmod(move.bit_length() - 1, 3) == legacy
+
+
+def check_all_positions():
+    positions = reachable_positions()
+    start = time.perf_counter()
+    assert AI_5.play_table() is not None
+    print(f"\nPerfect-play table loaded in {1000 * (time.perf_counter() - start):.1f} ms (built on first run)")
+
+    start = time.perf_counter()
+    table_moves = [AI_5.find_best_move(board) for board in positions]
+    lookup = (time.perf_counter() - start) / len(positions)
+    AI_5.transposition_table.clear()
+    start = time.perf_counter()
+    search_moves = []
+    for board in positions:
+        move = AI_5.best_move_bits(*AI_5.to_bitboards(board))
+        search_moves.append(divmod(move.bit_length() - 1, 3))
+    search = (time.perf_counter() - start) / len(positions)
+    for board, by_table, by_search in zip(positions, table_moves, search_moves):
+        assert by_table == by_search == legacy_best_move(board, [0]), board
+    print(f"Same move from table, search and full minimax in all {len(positions)} positions with O to move")
+    print(f"{'per move':<28}{'us':>10}")
+    print(f"{'alpha-beta + table':<28}{1e6 * search:>10.1f}")
+    print(f"{'perfect-play table':<28}{1e6 * lookup:>10.1f}")
+
+
+def evaluation_throughput(repeats=200):
+    # Every reachable position, terminal or not, on both representations
+    seen, frontier = set(), [(0, 0)]
+    while frontier:
+        x, o = frontier.pop()
+        if (x, o) in seen:
+            continue
+        seen.add((x, o))
+        if AI_5.evaluate_bits(x, o) or x | o == AI_5.FULL:
+            continue
+        x_turn = AI_5.popcount(x) == AI_5.popcount(o)
+        for move in AI_5.MOVES[AI_5.FULL & ~(x | o)]:
+            frontier.append((x | move, o) if x_turn else (x, o | move))
+    bitboards = list(seen)
+    boards = [AI_5.from_bitboards(x, o) for x, o in bitboards]
+    assert [legacy_evaluate(b) for b in boards] == [AI_5.evaluate_bits(x, o) for x, o in bitboards]
+
+    print(f"\n{len(bitboards)} reachable positions")
+    print(f"{'representation':<28}{'positions/sec':>16}")
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for board in boards:
+            legacy_evaluate(board)
+    rate = repeats * len(boards) / (time.perf_counter() - start)
+    print(f"{'list of lists':<28}{rate:>16,.0f}")
+    evaluate_bits = AI_5.evaluate_bits
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for x, o in bitboards:
+            evaluate_bits(x, o)
+    rate = repeats * len(bitboards) / (time.perf_counter() - start)
+    print(f"{'bitboards':<28}{rate:>16,.0f}")
+
+
+def gomoku_search(time_limit=2.0):
+    # 15x15, five in a row, from a few opening positions (cell = 15*row + col)
+    openings = {
+        "first reply": [(112, mnk_game.X)],
+        "open three": [(112, mnk_game.X), (113, mnk_game.O), (97, mnk_game.X),
+                       (98, mnk_game.O), (82, mnk_game.X)],
+        "midgame": [(112, mnk_game.X), (113, mnk_game.O), (128, mnk_game.X), (96, mnk_game.O),
+                    (144, mnk_game.X), (160, mnk_game.O), (127, mnk_game.X)],
+    }
+    print(f"\nGomoku 15x15, {time_limit:.1f}s per move, O to move")
+    print(f"{'position':<28}{'depth':>8}{'nodes':>10}{'nodes/sec':>12}{'move':>10}")
+    for label, stones in openings.items():
+        board = mnk_game.MNKBoard(15, 15, 5)
+        for cell, player in stones:
+            board.place(cell, player)
+        stats = {}
+        start = time.perf_counter()
+        move = mnk_game.search_best_move(board, mnk_game.O, time_limit, stats=stats)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<28}{stats['depth']:>8}{stats['nodes']:>10}{stats['nodes'] / elapsed:>12,.0f}"
+              f"{str(divmod(move, 15)):>10}")
+
+
+if __name__ == "__main__":
+    time_empty_board()
+    check_all_positions()
+    evaluation_throughput()
+    gomoku_search()
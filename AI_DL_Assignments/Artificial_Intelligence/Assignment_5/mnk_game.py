@@ -0,0 +1,196 @@
+# mnk_game.py
+#
+# Engine for m,n,k-games (k in a row on an m x n board; Tic-Tac-Toe is
+# 3,3,3 and Gomoku is 15,15,5). The board keeps per-window stone counts
+# so the threat evaluation and win test are updated incrementally, and
+# the search is iterative-deepening alpha-beta under a wall-clock budget
+# with a Zobrist-hashed transposition table and history move ordering.
+
+import random
+import time
+
+EMPTY, X, O = 0, 1, 2
+
+WIN = 1_000_000
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# ------------------- Board -------------------
+class MNKBoard:
+    # Cell (r, c) is index r*n + c. A window is one run of k cells in a
+    # row, column or diagonal; counts[p][w] is the number of p's stones in
+    # window w, and score is the sum of window values from O's side.
+    def __init__(self, m, n, k, seed=0):
+        self.m, self.n, self.k = m, n, k
+        self.cells = [EMPTY] * (m * n)
+        self.windows = []
+        for r in range(m):
+            for c in range(n):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                    if 0 <= end_r < m and 0 <= end_c < n:
+                        self.windows.append([(r + dr * i) * n + c + dc * i for i in range(k)])
+        self.cell_windows = [[] for _ in self.cells]
+        for w, window in enumerate(self.windows):
+            for cell in window:
+                self.cell_windows[cell].append(w)
+        self.counts = [None, [0] * len(self.windows), [0] * len(self.windows)]
+        # A window held by one player only is worth WEIGHTS[stones]
+        self.weights = [0] + [4 ** i for i in range(k - 1)] + [WIN]
+        self.score = 0
+
+        # Cells within two steps of a stone are the candidate moves
+        self.near = [0] * len(self.cells)
+        self.ring = [[(r + dr) * n + c + dc
+                      for dr in range(-2, 3) for dc in range(-2, 3)
+                      if (dr or dc) and 0 <= r + dr < m and 0 <= c + dc < n]
+                     for r in range(m) for c in range(n)]
+
+        rng = random.Random(seed)
+        self.zobrist = [None, [rng.getrandbits(64) for _ in self.cells],
+                        [rng.getrandbits(64) for _ in self.cells]]
+        self.side_key = [None, rng.getrandbits(64), rng.getrandbits(64)]
+        self.hash = 0
+        self.stones = 0
+        self.winner = EMPTY
+
+    def window_value(self, w):
+        x, o = self.counts[X][w], self.counts[O][w]
+        if x and o:
+            return 0
+        return self.weights[o] if o else -self.weights[x]
+
+    def place(self, cell, player):
+        score = self.score
+        counts = self.counts[player]
+        for w in self.cell_windows[cell]:
+            score -= self.window_value(w)
+            counts[w] += 1
+            score += self.window_value(w)
+            if counts[w] == self.k:
+                self.winner = player
+        self.score = score
+        self.cells[cell] = player
+        self.hash ^= self.zobrist[player][cell]
+        self.stones += 1
+        for nbr in self.ring[cell]:
+            self.near[nbr] += 1
+
+    def remove(self, cell):
+        player = self.cells[cell]
+        score = self.score
+        counts = self.counts[player]
+        for w in self.cell_windows[cell]:
+            score -= self.window_value(w)
+            counts[w] -= 1
+            score += self.window_value(w)
+        self.score = score
+        self.cells[cell] = EMPTY
+        self.hash ^= self.zobrist[player][cell]
+        self.stones -= 1
+        self.winner = EMPTY
+        for nbr in self.ring[cell]:
+            self.near[nbr] -= 1
+
+    def full(self):
+        return self.stones == len(self.cells)
+
+    def candidates(self):
+        if not self.stones:
+            return [(self.m // 2) * self.n + self.n // 2]
+        cells, near = self.cells, self.near
+        return [c for c in range(len(cells)) if cells[c] == EMPTY and near[c]]
+
+    @classmethod
+    def from_rows(cls, rows, k):
+        # Rows of "X"/"O"/"_" strings, as used by AI_5.print_board
+        board = cls(len(rows), len(rows[0]), k)
+        for r, row in enumerate(rows):
+            for c, mark in enumerate(row):
+                if mark != "_":
+                    board.place(r * board.n + c, X if mark == "X" else O)
+        return board
+
+# ------------------- Search -------------------
+class SearchTimeout(Exception):
+    pass
+
+def search_best_move(board, player, time_limit=1.0, max_depth=None, stats=None, table=None):
+    """
+    Iterative-deepening negamax with alpha-beta for `player` to move.
+    Each depth is searched to completion or abandoned when time_limit
+    seconds run out; the move of the deepest completed depth is returned.
+    Pass the same `table` dict between moves to keep the transposition
+    table warm.
+    """
+    deadline = time.perf_counter() + time_limit
+    table = {} if table is None else table
+    history = [0] * len(board.cells)
+    nodes = 0
+    max_depth = max_depth or len(board.cells) - board.stones
+
+    def negamax(player, depth, alpha, beta, ply):
+        nonlocal nodes
+        nodes += 1
+        if nodes & 1023 == 0 and time.perf_counter() > deadline:
+            raise SearchTimeout
+        sign = 1 if player == O else -1
+        if depth == 0:
+            return sign * board.score
+
+        alpha_orig = alpha
+        key = board.hash ^ board.side_key[player]
+        entry = table.get(key)
+        tt_move = None
+        if entry is not None:
+            e_depth, value, flag, tt_move = entry
+            if e_depth >= depth:
+                # Win scores are stored relative to this node
+                if value > WIN // 2: value -= ply
+                elif value < -WIN // 2: value += ply
+                if flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha):
+                    return value
+
+        moves = board.candidates()
+        moves.sort(key=history.__getitem__, reverse=True)
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        best, best_move = -WIN - 1, moves[0]
+        other = X + O - player
+        for move in moves:
+            board.place(move, player)
+            try:
+                if board.winner:
+                    value = WIN - ply
+                elif board.full():
+                    value = 0
+                else:
+                    value = -negamax(other, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                board.remove(move)
+            if value > best:
+                best, best_move = value, move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                history[move] += depth * depth
+                break
+
+        flag = UPPER if best <= alpha_orig else LOWER if best >= beta else EXACT
+        stored = best + ply if best > WIN // 2 else best - ply if best < -WIN // 2 else best
+        table[key] = (depth, stored, flag, best_move)
+        return best
+
+    best_move, completed = board.candidates()[0], 0
+    try:
+        for depth in range(1, max_depth + 1):
+            value = negamax(player, depth, -WIN - 1, WIN + 1, 0)
+            best_move, completed = table[board.hash ^ board.side_key[player]][3], depth
+            if abs(value) > WIN // 2:
+                break  # forced win or loss found
+    except SearchTimeout:
+        pass
+    if stats is not None:
+        stats["nodes"], stats["depth"] = nodes, completed
+    return best_move
@@ -11,10 +11,16 @@ Implemented Search Strategies:
 3. Min-Conflicts (Local Search)
 
 Each algorithm is demonstrated, and one valid board configuration is printed.
+Solutions can also be counted for larger N (count_solutions) or generated
+lazily one at a time (iter_solutions).
 """
 
+import mmap
+import os
 import random
-from collections import deque
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
 # -------------------------------------------------------------
 # Utility Functions
@@ -50,48 +56,177 @@ def solve_backtracking(N):
     """
     Classic DFS (Depth-First Search) backtracking approach.
     Places one queen per column and backtracks when a conflict arises.
+    Returns every solution; use iter_solutions or count_solutions to
+    avoid holding them all.
     """
-    solutions = []
+    return list(iter_solutions(N))
 
-    def backtrack(col, positions):
-        # Base Case: All queens are placed
-        if col == N:
-            solutions.append(positions.copy())
-            return
-
-        # Try placing a queen in each row of the current column
-        for row in range(N):
-            if is_safe(positions, col, row):
-                positions.append(row)
-                backtrack(col + 1, positions)
-                positions.pop()  # backtrack
 
-    backtrack(0, [])
-    return solutions
+def iter_solutions(N):
+    """
+    Yield the solutions one at a time, in the same order as
+    solve_backtracking. The rows and both diagonal directions already
+    attacked are kept as bitmasks, so a free row is found without
+    scanning the queens placed so far.
+    """
+    full = (1 << N) - 1
+    positions = []
+
+    def backtrack(rows, down, up):
+        # down/up: diagonals attacked in the current column, shifted one
+        # step per column
+        if rows == full:
+            yield positions.copy()
+            return
+        free = full & ~(rows | down | up)
+        while free:
+            bit = free & -free
+            free ^= bit
+            positions.append(bit.bit_length() - 1)
+            yield from backtrack(rows | bit, ((down | bit) << 1) & full, (up | bit) >> 1)
+            positions.pop()  # backtrack
+
+    return backtrack(0, 0, 0)
+
+
+def _count_from(full, rows, down, up):
+    # Number of ways to complete a partial placement given as bitmasks
+    free = full & ~(rows | down | up)
+    missing = full ^ rows
+    if not missing & (missing - 1):
+        # Last column: it solves the board if its one row is free
+        return 1 if free else 0
+    total = 0
+    while free:
+        bit = free & -free
+        free ^= bit
+        total += _count_from(full, rows | bit, ((down | bit) << 1) & full, (up | bit) >> 1)
+    return total
+
+
+def _count_subtree(N, first, second):
+    # Solutions with the first two queens in rows first and second
+    full = (1 << N) - 1
+    a, b = 1 << first, 1 << second
+    down, up = ((a << 1) & full), a >> 1
+    if b & (a | down | up):
+        return 0
+    return _count_from(full, a | b, ((down | b) << 1) & full, (up | b) >> 1)
+
+
+def count_solutions(N, workers=None):
+    """
+    Count the solutions without building them. Mirroring the board top
+    to bottom maps a solution with its first queen in row r to one with
+    it in row N-1-r, so only the top half of the first column is
+    searched and doubled (plus the middle row once when N is odd). The
+    remaining subtrees, split by the first two queens, run on a process
+    pool.
+    """
+    if N == 1:
+        return 1
+    tasks = [(first, second) for first in range((N + 1) // 2) for second in range(N)]
+    weights = [1 if N % 2 and first == N // 2 else 2 for first, _ in tasks]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or N < 10:
+        counts = [_count_subtree(N, first, second) for first, second in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            counts = list(pool.map(_count_subtree, [N] * len(tasks), *zip(*tasks)))
+    return sum(w * c for w, c in zip(weights, counts))
 
 
 # -------------------------------------------------------------
 # 2. Breadth-First Search
 # -------------------------------------------------------------
-def solve_bfs(N):
+def _expand_level(N, states, width):
+    """
+    Children of a block of partial states, each packed as 'width' bytes
+    (the row of the queen in each column so far), in BFS order.
+    """
+    full = (1 << N) - 1
+    children = bytearray()
+    for start in range(0, len(states), width):
+        state = states[start:start + width]
+        rows = down = up = 0
+        for c, r in enumerate(state):
+            bit = 1 << r
+            rows |= bit
+            down |= bit << (width - c)
+            up |= bit >> (width - c)
+        free = full & ~(rows | down | up)
+        while free:
+            bit = free & -free
+            free ^= bit
+            children += state
+            children.append(bit.bit_length() - 1)
+    return children
+
+
+def _level_chunks(level, width, chunk):
+    # Blocks of 'chunk' states; pages of a spilled level that have been
+    # read are released again so the mapping does not grow the RSS
+    step = chunk * width
+    dropped = 0
+    for start in range(0, len(level), step):
+        yield level[start:start + step]
+        if isinstance(level, mmap.mmap) and hasattr(mmap, "MADV_DONTNEED"):
+            done = (start + step) // mmap.PAGESIZE * mmap.PAGESIZE
+            if done > dropped:
+                level.madvise(mmap.MADV_DONTNEED, dropped, done - dropped)
+                dropped = done
+
+
+def solve_bfs(N, chunk=4096, spill_dir=None):
     """
     BFS builds partial solutions level by level (column by column).
-    Each node in the queue represents a partial placement of queens.
+    Each level is one packed byte string with a fixed-width row per
+    partial placement, expanded 'chunk' states at a time. With
+    'spill_dir', each new level is written to a temporary file there and
+    read back through mmap, so memory stays bounded by the chunk size
+    instead of the frontier size. Returns the same solution as
+    expanding a queue of lists in FIFO order.
     """
-    queue = deque([[]])  # Start with an empty board
-    while queue:
-        state = queue.popleft()
-        col = len(state)
-
-        # If 8 queens are placed, return the first complete solution
-        if col == N:
-            return state
-
-        # Try extending the current partial solution
-        for row in range(N):
-            if is_safe(state, col, row):
-                queue.append(state + [row])
-    return None
+    if N > 255:
+        raise ValueError("solve_bfs packs one row per byte, so N must be at most 255.")
+    if N <= 1:
+        return [0] * N
+    level = bytes(range(N))  # Level 1: a queen in every row of column 0
+    spills = []  # open temporary files backing the current and next level
+    try:
+        for width in range(1, N):
+            if spill_dir is None:
+                next_level = bytearray()
+            else:
+                next_level = tempfile.TemporaryFile(dir=spill_dir)
+                spills.append(next_level)
+            for states in _level_chunks(level, width, chunk):
+                children = _expand_level(N, states, width)
+                # If N queens are placed, return the first complete solution
+                if width + 1 == N and children:
+                    return list(children[:N])
+                if spill_dir is None:
+                    next_level += children
+                else:
+                    next_level.write(children)
+
+            if isinstance(level, mmap.mmap):
+                level.close()
+                spills.pop(0).close()
+            if spill_dir is None:
+                level = next_level
+            else:
+                next_level.flush()
+                size = next_level.tell()
+                level = mmap.mmap(next_level.fileno(), size, access=mmap.ACCESS_READ) if size else b""
+            if not level:
+                return None
+        return None
+    finally:
+        if isinstance(level, mmap.mmap):
+            level.close()
+        for f in spills:
+            f.close()
 
 
 # -------------------------------------------------------------
@@ -106,34 +241,147 @@ def conflicts_for(positions, col, row):
     return count
 
 
-def solve_min_conflicts(N, max_steps=10000, max_restarts=50):
+class QueenCounters:
+    """
+    Occupancy of every row and both diagonal directions, kept in compact
+    arrays so a queen is placed or lifted in O(1). Queen (col, row) lies
+    on down diagonal row - col + N - 1 and up diagonal row + col. Each
+    line also keeps the XOR of the columns on it, which names the queen
+    when exactly one is left. Every column with a conflict is in
+    'conflicted'; columns that lost their last conflict are dropped
+    lazily when picked.
+    """
+
+    def __init__(self, N):
+        self.N = N
+        self.positions = array("i", [0]) * N
+        self.rows, self.row_cols = array("i", [0]) * N, array("i", [0]) * N
+        self.down, self.down_cols = array("i", [0]) * (2 * N - 1), array("i", [0]) * (2 * N - 1)
+        self.up, self.up_cols = array("i", [0]) * (2 * N - 1), array("i", [0]) * (2 * N - 1)
+        self.conflicted = []
+        self.listed = bytearray(N)
+        self.empty_rows = []  # rows that were emptied; may hold stale entries
+
+    def cost(self, col, row):
+        """Queens in the row and diagonals of (col, row), counting its own."""
+        return self.rows[row] + self.down[row - col + self.N - 1] + self.up[row + col]
+
+    def has_conflict(self, col):
+        return self.cost(col, self.positions[col]) > 3
+
+    def mark(self, col):
+        if not self.listed[col]:
+            self.listed[col] = 1
+            self.conflicted.append(col)
+
+    def place(self, col, row):
+        d, u = row - col + self.N - 1, row + col
+        # A queen alone on one of these lines is attacked from now on
+        if self.rows[row] == 1:
+            self.mark(self.row_cols[row])
+        if self.down[d] == 1:
+            self.mark(self.down_cols[d])
+        if self.up[u] == 1:
+            self.mark(self.up_cols[u])
+        self.rows[row] += 1
+        self.down[d] += 1
+        self.up[u] += 1
+        self.row_cols[row] ^= col
+        self.down_cols[d] ^= col
+        self.up_cols[u] ^= col
+        self.positions[col] = row
+        if self.rows[row] + self.down[d] + self.up[u] > 3:
+            self.mark(col)
+
+    def lift(self, col):
+        row = self.positions[col]
+        d, u = row - col + self.N - 1, row + col
+        self.rows[row] -= 1
+        self.down[d] -= 1
+        self.up[u] -= 1
+        self.row_cols[row] ^= col
+        self.down_cols[d] ^= col
+        self.up_cols[u] ^= col
+        if not self.rows[row]:
+            self.empty_rows.append(row)
+
+
+def greedy_placement(N, tries=60):
+    """
+    Initial placement for min-conflicts: column by column, a queen goes
+    to a row no queen uses yet, picked at random, retrying up to 'tries'
+    times to find one whose diagonals are free as well. Rows never clash
+    and only the last few columns are usually left with conflicts.
+    """
+    board = QueenCounters(N)
+    cost, randrange = board.cost, random.randrange
+    unused = list(range(N))
+    for col in range(N):
+        best, best_i = None, 0
+        for _ in range(tries):
+            i = randrange(len(unused))
+            c = cost(col, unused[i])
+            if best is None or c < best:
+                best, best_i = c, i
+                if not c:
+                    break
+        row = unused[best_i]
+        unused[best_i] = unused[-1]
+        unused.pop()
+        board.place(col, row)
+    return board
+
+
+def solve_min_conflicts(N, max_steps=10000, max_restarts=50, sample=100, stats=None):
     """
     Local search algorithm:
-    - Start with a random configuration.
+    - Start with a greedy low-conflict configuration.
     - Repeatedly move a conflicted queen to a position with minimum conflicts.
     - Restart if stuck.
+    Conflict counts come from QueenCounters, so a move costs O(1) rather
+    than a rescan of the board. Boards larger than 'sample' rows score a
+    random sample of rows plus the empty ones instead of every row.
     """
+    if stats is not None:
+        stats["steps"] = 0
     for restart in range(max_restarts):
-        positions = [random.randrange(N) for _ in range(N)]
-
-        for step in range(max_steps):
-            # Find columns with conflicts
-            conflict_cols = [c for c in range(N) if conflicts_for(positions, c, positions[c]) > 0]
-
-            if not conflict_cols:
-                # Solution found
-                return positions
+        board = greedy_placement(N)
+        conflicted, listed = board.conflicted, board.listed
 
+        steps = 0
+        while conflicted:
             # Choose a random conflicted column
-            col = random.choice(conflict_cols)
+            i = random.randrange(len(conflicted))
+            col = conflicted[i]
+            if not board.has_conflict(col):
+                conflicted[i] = conflicted[-1]
+                conflicted.pop()
+                listed[col] = 0
+                continue
+            if steps == max_steps:
+                break
+            steps += 1
+            if stats is not None:
+                stats["steps"] += 1
 
             # Find row with minimum conflict in that column
-            conflict_counts = [conflicts_for(positions, col, r) for r in range(N)]
+            board.lift(col)
+            if N <= sample:
+                candidates = range(N)
+            else:
+                board.empty_rows = [r for r in set(board.empty_rows) if not board.rows[r]]
+                candidates = board.empty_rows + [random.randrange(N) for _ in range(sample)]
+            conflict_counts = [board.cost(col, r) for r in candidates]
             min_conflict = min(conflict_counts)
-            best_rows = [r for r, val in enumerate(conflict_counts) if val == min_conflict]
+            best_rows = [r for r, val in zip(candidates, conflict_counts) if val == min_conflict]
 
             # Move queen to the best row (break ties randomly)
-            positions[col] = random.choice(best_rows)
+            board.place(col, random.choice(best_rows))
+        else:
+            # Solution found
+            if stats is not None:
+                stats["restarts"] = restart
+            return board.positions.tolist()
     return None
 
 
@@ -0,0 +1,144 @@
+# bench_AI_6.py
+#
+# N-Queens solution counting: the original list-based backtracking
+# against bitmask counting with mirror symmetry, on one process and on
+# a process pool; min-conflicts time-to-solution from N = 1,000 to
+# N = 1,000,000 against the original rescanning version; and time and
+# peak RSS of the original queue-of-lists BFS against the packed
+# level-synchronous BFS, in memory and spilled to disk.
+# Usage: python bench_AI_6.py [max_n] [workers] [max_queens] [bfs_n]
+
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import AI_6
+
+KNOWN_COUNTS = {8: 92, 9: 352, 10: 724, 11: 2680, 12: 14200, 13: 73712, 14: 365596,
+                15: 2279184, 16: 14772512, 17: 95815104}
+
+
+def legacy_count(N):
+    solutions = []
+
+    def backtrack(col, positions):
+        if col == N:
+            solutions.append(positions.copy())
+            return
+        for row in range(N):
+            if AI_6.is_safe(positions, col, row):
+                positions.append(row)
+                backtrack(col + 1, positions)
+                positions.pop()
+
+    backtrack(0, [])
+    return len(solutions)
+
+
+def legacy_min_conflicts(N, max_steps=10000):
+    positions = [random.randrange(N) for _ in range(N)]
+    for _ in range(max_steps):
+        conflict_cols = [c for c in range(N) if AI_6.conflicts_for(positions, c, positions[c]) > 0]
+        if not conflict_cols:
+            return positions
+        col = random.choice(conflict_cols)
+        conflict_counts = [AI_6.conflicts_for(positions, col, r) for r in range(N)]
+        min_conflict = min(conflict_counts)
+        positions[col] = random.choice([r for r, val in enumerate(conflict_counts) if val == min_conflict])
+    return None
+
+
+def legacy_bfs(N):
+    queue = deque([[]])
+    while queue:
+        state = queue.popleft()
+        if len(state) == N:
+            return state
+        for row in range(N):
+            if AI_6.is_safe(state, len(state), row):
+                queue.append(state + [row])
+    return None
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def counting_benchmark(max_n=13, workers=None, legacy_max=10):
+    workers = workers or os.cpu_count() or 1
+    print(f"{'N':<6}{'solutions':>12}{'list-based':>14}{'bitmask':>12}{f'{workers} workers':>14}")
+    for n in range(8, max_n + 1):
+        legacy = f"{timed(legacy_count, n)[1]:.3f}s" if n <= legacy_max else "-"
+        single, single_time = timed(AI_6.count_solutions, n, 1)
+        pooled, pooled_time = timed(AI_6.count_solutions, n, workers)
+        assert single == pooled == KNOWN_COUNTS[n], n
+        print(f"{n:<6}{single:>12,}{legacy:>14}{single_time:>11.3f}s{pooled_time:>13.3f}s")
+
+
+def min_conflicts_benchmark(max_queens=1_000_000, legacy_sizes=(50, 100)):
+    random.seed(0)
+    print("\nMin-conflicts")
+    print(f"{'N':>10}{'solve':>10}{'greedy start':>14}{'conflicted':>12}{'repairs':>10}{'restarts':>10}")
+    for n in legacy_sizes:
+        solution, elapsed = timed(legacy_min_conflicts, n)
+        status = f"{elapsed:.2f}s" if solution else "failed"
+        print(f"{n:>10,}{status:>10}{'(original)':>14}")
+    n = 1000
+    while n <= max_queens:
+        board, greedy = timed(AI_6.greedy_placement, n)
+        conflicted = sum(board.has_conflict(c) for c in range(n))
+        stats = {}
+        solution, elapsed = timed(AI_6.solve_min_conflicts, n, 10000, 50, 100, stats)
+        check = AI_6.QueenCounters(n)
+        for col, row in enumerate(solution):
+            check.place(col, row)
+        assert not check.conflicted, n
+        print(f"{n:>10,}{elapsed:>9.2f}s{greedy:>13.2f}s{conflicted:>12}{stats['steps']:>10}{stats['restarts']:>10}")
+        n *= 10
+
+
+def measured(fn, *args):
+    # Runs in a fresh worker process, so ru_maxrss is this call's peak
+    result, elapsed = timed(fn, *args)
+    return result, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def in_process(fn, *args):
+    with ProcessPoolExecutor(1) as pool:
+        return pool.submit(measured, fn, *args).result()
+
+
+def bfs_benchmark(max_n=12, legacy_max=12):
+    spill_dir = tempfile.mkdtemp()
+    baseline = in_process(len, ())[2]
+    print(f"\nBreadth-first search (peak RSS of a worker, idle worker {baseline / 1024:.0f} MB)")
+    print(f"{'N':<6}{'variant':<24}{'time':>10}{'peak RSS':>12}")
+    for n in range(8, max_n + 1):
+        variants = [("packed levels", AI_6.solve_bfs, (n,)),
+                    ("packed, spilled", AI_6.solve_bfs, (n, 4096, spill_dir))]
+        if n <= legacy_max:
+            variants.insert(0, ("queue of lists", legacy_bfs, (n,)))
+        expected = None
+        for label, fn, args in variants:
+            solution, elapsed, peak = in_process(fn, *args)
+            assert expected is None or solution == expected, (n, label)
+            expected = solution
+            print(f"{n:<6}{label:<24}{elapsed:>9.2f}s{peak / 1024:>9.0f} MB")
+    os.rmdir(spill_dir)
+
+
+if __name__ == "__main__":
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 13
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    max_queens = int(sys.argv[3]) if len(sys.argv) > 3 else 1_000_000
+    bfs_n = int(sys.argv[4]) if len(sys.argv) > 4 else 12
+    counting_benchmark(max_n, workers)
+    min_conflicts_benchmark(max_queens)
+    bfs_benchmark(bfs_n)
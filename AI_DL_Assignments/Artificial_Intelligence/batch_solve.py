@@ -0,0 +1,219 @@
+"""
+Batch Solver for the Search Assignments (AI_1 / AI_4)
+-----------------------------------------------------
+
+Solves many queries without the interactive menus, fanning them out over
+a process pool and streaming one JSON object per query, in input order.
+
+Input (file or any iterable of lines):
+  - puzzle solvers: one board per line as N*N numbers, row-major, 0 for
+    the blank, optionally followed by ';' and a goal board (bidirectional
+    and astar only; the other solvers search for the standard goal)
+  - graph solver: one "start goal" pair per line (node names)
+
+Read-only tables (the 8-puzzle distance table and pattern databases) are
+built once in the parent and memory-mapped by every worker, so they are
+shared through the OS page cache instead of being pickled per task. A
+road graph loaded in the parent is inherited by forked workers.
+
+Usage: python batch_solve.py queries.txt --solver astar-pdb --workers 8
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, "Assignment_1"))
+sys.path.append(os.path.join(HERE, "Assignment_4"))
+
+import AI_1
+import AI_4
+import npuzzle
+import pattern_db
+import road_graph
+
+SOLVERS = ["bfs", "bidirectional", "idastar", "table", "astar", "astar-pdb", "graph"]
+# Solvers that can only reach npuzzle.goal_board
+STANDARD_GOAL_SOLVERS = ["bfs", "idastar", "table", "astar-pdb"]
+
+# Per-process state, filled by _init_worker (inherited under fork)
+_config = {}
+
+
+# -------------------------------------------------------------
+# Parsing
+# -------------------------------------------------------------
+
+def parse_board(text):
+    tiles = list(map(int, text.split()))
+    n = math.isqrt(len(tiles))
+    if n * n != len(tiles):
+        raise ValueError(f"Board must have a square number of tiles, got {len(tiles)}.")
+    if sorted(tiles) != list(range(n * n)):
+        raise ValueError(f"Board must contain each of 0..{n * n - 1} exactly once.")
+    return [tiles[i * n:(i + 1) * n] for i in range(n)]
+
+
+def parse_query(line, solver):
+    if solver == "graph":
+        start, goal = line.split()
+        return start, goal
+    start, _, goal = line.partition(";")
+    start = parse_board(start)
+    if not goal.strip():
+        return start, npuzzle.goal_board(len(start))
+    goal = parse_board(goal)
+    if len(goal) != len(start):
+        raise ValueError(f"Goal is {len(goal)}x{len(goal)} but the start board is {len(start)}x{len(start)}.")
+    return start, goal
+
+
+# -------------------------------------------------------------
+# Workers
+# -------------------------------------------------------------
+
+def _init_worker(solver, n, graph_path, directed, landmarks):
+    _config.clear()
+    _config["solver"] = solver
+    _config["n"] = n
+    if solver == "table":
+        _config["table"] = AI_1.load_distance_table()
+    elif solver == "astar-pdb":
+        _config["heuristic"] = pattern_db.make_heuristic(pattern_db.load_pattern_dbs(n))
+    elif solver == "graph":
+        graph = _parent_graph or road_graph.load_edge_list(graph_path, directed)
+        _config["graph"] = graph
+        _config["heuristic"] = road_graph.alt_heuristic(
+            _parent_landmarks or road_graph.build_landmarks(graph, landmarks, directed))
+
+
+def _solve_one(start, goal):
+    solver = _config["solver"]
+    stats = {}
+    if solver == "graph":
+        graph = _config["graph"]
+        return next(road_graph.batch_query(graph, [(start, goal)], _config["heuristic"])), stats
+    if solver in ("bfs", "bidirectional", "table") and len(start) != 3:
+        raise ValueError(f"Solver {solver!r} only handles 3x3 boards.")
+    if solver == "astar-pdb" and len(start) != _config["n"]:
+        raise ValueError(f"Pattern databases were built for {_config['n']}x{_config['n']} boards, "
+                         f"got {len(start)}x{len(start)}; pass --size.")
+    standard_goal = goal == npuzzle.goal_board(len(start))
+    if solver in STANDARD_GOAL_SOLVERS and not standard_goal:
+        raise ValueError(f"Solver {solver!r} only solves to the standard goal board.")
+    if standard_goal and not npuzzle.is_solvable(start):
+        return (None, None), stats
+    if solver == "bfs":
+        path = AI_1.bfs(start, stats=stats)
+    elif solver == "bidirectional":
+        path = AI_1.bidirectional_bfs(start, goal, stats=stats)
+    elif solver == "table":
+        path = AI_1.solve_with_table(start, _config["table"])
+    elif solver == "idastar":
+        path = npuzzle.ida_star(start, stats)
+    else:
+        heuristic = _config.get("heuristic", AI_4.heuristic_puzzle)
+        path, _ = AI_4.a_star_search(start, goal, AI_4.neighbors_puzzle, heuristic, AI_4.puzzle_key)
+    return (path, len(path) - 1 if path else None), stats
+
+
+def _solve_chunk(chunk, include_path):
+    results = []
+    for index, line in chunk:
+        record = {"id": index, "query": line}
+        began = time.perf_counter()
+        try:
+            (path, cost), stats = _solve_one(*parse_query(line, _config["solver"]))
+        except (ValueError, KeyError) as exc:
+            record["error"] = str(exc)
+        except Exception as exc:
+            # One failing query must not end the stream for the rest
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        else:
+            record["cost"] = cost if cost is None or cost < math.inf else None
+            record.update(stats)
+            if include_path:
+                record["path"] = path
+        record["seconds"] = round(time.perf_counter() - began, 6)
+        results.append(record)
+    return results
+
+
+# -------------------------------------------------------------
+# Batch API
+# -------------------------------------------------------------
+
+_parent_graph = None
+_parent_landmarks = None
+
+
+def solve_batch(lines, solver="astar", n=3, workers=None, chunksize=32,
+                include_path=True, graph_path=None, directed=False, landmarks=8):
+    """
+    Yield one result dict per non-blank input line, in input order.
+    At most a few chunks per worker are in flight at a time, so arbitrarily
+    long inputs are streamed rather than read up front.
+    """
+    global _parent_graph, _parent_landmarks
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver!r}, expected one of {SOLVERS}.")
+    if solver == "graph" and graph_path is None:
+        raise ValueError("The graph solver needs an edge-list file (graph_path).")
+
+    # Build shared tables once, before any worker starts
+    if solver == "table":
+        AI_1.load_distance_table()
+    elif solver == "astar-pdb":
+        pattern_db.load_pattern_dbs(n)
+    elif solver == "graph":
+        _parent_graph = road_graph.load_edge_list(graph_path, directed)
+        _parent_landmarks = road_graph.build_landmarks(_parent_graph, landmarks, directed)
+
+    workers = workers or os.cpu_count() or 1
+    queries = ((i, line.strip()) for i, line in enumerate(lines) if line.strip())
+    init_args = (solver, n, graph_path, directed, landmarks)
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=init_args) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < 4 * workers:
+                chunk = list(islice(queries, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_solve_chunk, chunk, include_path))
+            if not pending:
+                break
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve puzzle or graph queries in parallel, one JSON line each.")
+    parser.add_argument("input", help="query file, or - for stdin")
+    parser.add_argument("--solver", choices=SOLVERS, default="astar")
+    parser.add_argument("--size", type=int, default=3, help="board size N for astar-pdb")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=32)
+    parser.add_argument("--no-path", action="store_true", help="omit solution paths from the output")
+    parser.add_argument("--graph", help="edge-list file for the graph solver")
+    parser.add_argument("--directed", action="store_true")
+    parser.add_argument("--landmarks", type=int, default=8)
+    args = parser.parse_args(argv)
+    if args.solver == "graph" and args.graph is None:
+        parser.error("--solver graph requires --graph")
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    with source:
+        for record in solve_batch(source, args.solver, args.size, args.workers, args.chunksize,
+                                  not args.no_path, args.graph, args.directed, args.landmarks):
+            print(json.dumps(record), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+N x N Sliding Puzzle (8-, 15-, 24-puzzle) - IDA* Search
+-------------------------------------------------------
+
+Shared by the 8-puzzle menu in Assignment_1 and the A* menu in Assignment_4.
+
+Boards are lists of rows with 0 for the blank, and the goal is
+1, 2, ..., N*N - 1 followed by the blank. IDA* keeps only the current
+branch in memory (linear in the solution depth) and updates the
+Manhattan distance incrementally: a move changes the distance of the
+single tile that slides.
+"""
+
+import math
+
+# -------------------------------------------------------------
+# Board Helpers
+# -------------------------------------------------------------
+
+def goal_board(n):
+    tiles = list(range(1, n * n)) + [0]
+    return [tiles[i * n:(i + 1) * n] for i in range(n)]
+
+
+def flatten(board):
+    return [v for row in board for v in row]
+
+
+def is_solvable(board):
+    """Inversion-parity test against the standard goal layout."""
+    n = len(board)
+    tiles = flatten(board)
+    nums = [v for v in tiles if v != 0]
+    inversions = sum(1 for i in range(len(nums)) for j in range(i + 1, len(nums)) if nums[i] > nums[j])
+    if n % 2 == 1:
+        return inversions % 2 == 0
+    # On even widths a vertical move also shifts the blank's row parity
+    return (inversions + tiles.index(0) // n) % 2 == (n - 1) % 2
+
+
+def move_table(n):
+    """For every blank position, the cells a tile can slide in from."""
+    table = []
+    for b in range(n * n):
+        x, y = divmod(b, n)
+        table.append(tuple(nx * n + ny for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                           if 0 <= nx < n and 0 <= ny < n))
+    return table
+
+
+def manhattan_table(n):
+    """dist[tile][cell] = Manhattan distance of tile at cell from its goal cell."""
+    dist = [[0] * (n * n)]
+    for tile in range(1, n * n):
+        gx, gy = divmod(tile - 1, n)
+        dist.append([abs(c // n - gx) + abs(c % n - gy) for c in range(n * n)])
+    return dist
+
+
+def input_board(n):
+    print(f"Enter the {n}x{n} puzzle row by row (use 0 for blank):")
+    board = []
+    for i in range(n):
+        row = list(map(int, input(f"Row {i+1}: ").split()))
+        if len(row) != n:
+            raise ValueError(f"Each row must have exactly {n} numbers.")
+        board.append(row)
+    if sorted(flatten(board)) != list(range(n * n)):
+        raise ValueError(f"The board must contain each of 0..{n * n - 1} exactly once.")
+    return board
+
+
+# -------------------------------------------------------------
+# IDA* Search
+# -------------------------------------------------------------
+
+FOUND = -1
+
+
+def ida_star(board, stats=None):
+    """
+    Return the optimal list of boards from 'board' to the goal, or None
+    if the board is unsolvable. 'stats' (a dict) receives the number of
+    nodes expanded overall and per threshold iteration.
+    """
+    if stats is not None:
+        stats["expanded"] = 0
+        stats["iterations"] = []
+    if not is_solvable(board):
+        return None
+
+    n = len(board)
+    tiles = flatten(board)
+    neighbors = move_table(n)
+    dist = manhattan_table(n)
+    path = []  # cells the blank moved to, in order
+    expanded = 0
+
+    def search(blank, g, h, bound, prev):
+        nonlocal expanded
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0:
+            return FOUND
+        expanded += 1
+        smallest = math.inf
+        for cell in neighbors[blank]:
+            if cell == prev:  # never undo the previous move
+                continue
+            tile = tiles[cell]
+            tiles[blank], tiles[cell] = tile, 0
+            path.append(cell)
+            result = search(cell, g + 1, h + dist[tile][blank] - dist[tile][cell], bound, blank)
+            if result == FOUND:
+                return FOUND
+            path.pop()
+            tiles[cell], tiles[blank] = tile, 0
+            smallest = min(smallest, result)
+        return smallest
+
+    start = tiles[:]
+    blank = tiles.index(0)
+    h = sum(dist[t][c] for c, t in enumerate(tiles))
+    bound = h
+    while True:
+        expanded = 0
+        result = search(blank, 0, h, bound, None)
+        if stats is not None:
+            stats["expanded"] += expanded
+            stats["iterations"].append(expanded)
+        if result == FOUND:
+            break
+        bound = result
+
+    # Replay the blank's moves to rebuild the boards along the path
+    tiles = start
+    solution = [board]
+    for cell in path:
+        tiles[blank], tiles[cell] = tiles[cell], 0
+        blank = cell
+        solution.append([tiles[i * n:(i + 1) * n] for i in range(n)])
+    return solution
@@ -0,0 +1,129 @@
+"""
+Additive Pattern Databases for the N x N Sliding Puzzle
+-------------------------------------------------------
+
+A pattern database (PDB) stores, for every placement of a subset of the
+tiles, the exact number of moves of *those* tiles needed to bring them
+home, ignoring the identity of all other tiles. If the tile subsets are
+disjoint and only pattern-tile moves are counted, the lookups of the
+individual databases can be added and the sum is still admissible.
+
+Each database is built once by a 0-1 BFS backwards from the goal and
+written to disk as a flat byte array (one byte per placement, indexed by
+the positions of the pattern tiles in base N*N), then memory-mapped on
+load. Table size is (N*N) ** len(tiles) bytes.
+"""
+
+import mmap
+import os
+from collections import deque
+
+import npuzzle
+
+PDB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Disjoint tile groups used when no partition is given
+DEFAULT_PARTITIONS = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15)],
+}
+
+UNSEEN = 255
+
+
+# -------------------------------------------------------------
+# Building
+# -------------------------------------------------------------
+
+def pattern_db_path(n, tiles, directory=PDB_DIR):
+    return os.path.join(directory, f"pdb_{n}x{n}_{'-'.join(map(str, tiles))}.bin")
+
+
+def build_pattern_db(n, tiles):
+    """Return the PDB for 'tiles' on an n x n board as a bytearray."""
+    cells = n * n
+    k = len(tiles)
+    weights = [cells ** i for i in range(k)]
+    neighbors = npuzzle.move_table(n)
+
+    # Abstract state = pattern-tile positions + blank cell; blank moves
+    # through non-pattern cells are free, pattern-tile moves cost 1
+    positions = tuple(tile - 1 for tile in tiles)
+    index = sum(p * w for p, w in zip(positions, weights))
+    blank = cells - 1
+    dist = bytearray([UNSEEN]) * (cells ** k * cells)
+    dist[index * cells + blank] = 0
+    queue = deque([(positions, index, blank, 0)])
+
+    while queue:
+        positions, index, blank, d = queue.popleft()
+        if dist[index * cells + blank] < d:
+            continue  # stale entry, reached more cheaply since
+        for cell in neighbors[blank]:
+            if cell in positions:
+                i = positions.index(cell)
+                new_positions = positions[:i] + (blank,) + positions[i + 1:]
+                new_index = index + (blank - cell) * weights[i]
+                nd = d + 1
+            else:
+                new_positions, new_index, nd = positions, index, d
+            slot = new_index * cells + cell
+            if nd < dist[slot]:
+                dist[slot] = nd
+                if nd == d:
+                    queue.appendleft((new_positions, new_index, cell, nd))
+                else:
+                    queue.append((new_positions, new_index, cell, nd))
+
+    # Minimise over the blank position to get one byte per placement
+    table = bytearray(cells ** k)
+    for index in range(cells ** k):
+        table[index] = min(dist[index * cells:(index + 1) * cells])
+    return table
+
+
+# -------------------------------------------------------------
+# Loading and Lookup
+# -------------------------------------------------------------
+
+def load_pattern_dbs(n, partition=None, directory=PDB_DIR):
+    """
+    Memory-map the databases for 'partition', building any that are
+    missing. Returns a list of (tiles, weights, table) triples.
+    """
+    dbs = []
+    for tiles in partition or DEFAULT_PARTITIONS[n]:
+        path = pattern_db_path(n, tiles, directory)
+        if not os.path.exists(path):
+            table = build_pattern_db(n, tiles)
+            # Written aside and renamed, so an interrupted build never
+            # leaves a truncated database behind
+            with open(path + ".tmp", "wb") as f:
+                f.write(table)
+            os.replace(path + ".tmp", path)
+        with open(path, "rb") as f:
+            table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        dbs.append((tiles, [(n * n) ** i for i in range(len(tiles))], table))
+    return dbs
+
+
+def make_heuristic(dbs):
+    """
+    Build a heuristic_fn(state, goal) for a_star_search from loaded PDBs.
+    The databases are relative to the standard goal, so 'goal' is ignored.
+    """
+    def heuristic(state, goal):
+        where = {}
+        for c, tile in enumerate(v for row in state for v in row):
+            where[tile] = c
+        return sum(table[sum(where[t] * w for t, w in zip(tiles, weights))]
+                   for tiles, weights, table in dbs)
+    return heuristic
+
+
+if __name__ == "__main__":
+    # Build the default databases offline: python pattern_db.py [N]
+    import sys
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    for tiles, _, table in load_pattern_dbs(size):
+        print(f"tiles {tiles}: {len(table)} bytes, max {max(b for b in table[:] if b != UNSEEN)} moves")